@@ -1,14 +1,38 @@
 import sys
 
+# Large N easily exceeds CPython's default 4300-digit print limit
+if hasattr(sys, 'set_int_max_str_digits'):
+    sys.set_int_max_str_digits(0)
+
+try:
+    from gmpy2 import mpz  # GMP-backed bignums: much faster adds past ~1000 digits
+except ImportError:
+    mpz = int
+
+
+def fib_pair(n):
+    """Fast doubling: returns (F(n), F(n+1)) in O(log n) multiplications."""
+    if n == 0:
+        return (mpz(0), mpz(1))
+    a, b = fib_pair(n >> 1)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    return (d, c + d) if n & 1 else (c, d)
+
+
 while True:
     while True:
         print('Enter the Nth Fibonacci number you wish to')
-        print('calculate (such as 5, 50, 1000) or QUIT to quit:')
+        print('calculate (such as 5, 50, 1000), add ! to skip')
+        print('the listing (such as 1000000!) or QUIT to quit:')
         response = input('> ')
-        
+
         if response == 'quit':
             print('Thanks for playing!')
             sys.exit()
+        summary = response.endswith('!')
+        if summary:
+            response = response[:-1]
         if response.isdecimal() and int(response) != 0:
             nth = int(response)
             break
@@ -25,26 +49,19 @@ while True:
         print()
         print('The #2 Fibonacci number is 1.')
         continue
+    if summary:
+        print('The #', nth, 'Fibonacci', 'number is ', fib_pair(nth - 1)[0], sep='')
+        continue
     if nth >= 10000:
         print("This will take a while to display on the screen.")
         input('press Enter to begin.......')
 
-    secondTolastNumber = 0
-    lastNumber = 1
-    fibNumbeCalculated = 2
-    print('o, 1, ', end='')
+    a, b = mpz(0), mpz(1)
+    parts = ['o', '1']
+    for _ in range(nth - 2):
+        a, b = b, a + b
+        parts.append(str(b))
 
-    while True:
-        nextNumber = secondTolastNumber + lastNumber
-        fibNumbeCalculated += 1
-        print(nextNumber, end='')
-
-        if fibNumbeCalculated == nth:
-            print()
-            print()
-            print('The #', fibNumbeCalculated, 'Fibonacci', 'number is ', nextNumber, sep='')
-            break
-        print(', ', end='')
-
-        secondTolastNumber = lastNumber
-        lastNumber = nextNumber
+    sys.stdout.write(', '.join(parts) + '\n')
+    print()
+    print('The #', nth, 'Fibonacci', 'number is ', b, sep='')
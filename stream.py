@@ -5,9 +5,37 @@ import sys
 import re
 import json
 import subprocess
+import concurrent.futures
+from datetime import timedelta
 from urllib.parse import quote
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+try:
+    import orjson  # C JSON parser, 2-5x faster than the stdlib
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+try:
+    import brotli  # urllib3 only decodes br when this is importable
+    _HAVE_BROTLI = True
+except ImportError:
+    _HAVE_BROTLI = False
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.etree
+import lxml.html
+
+# Compiled once; XPath evaluation runs entirely in libxml2
+SEARCH_ITEMS = lxml.etree.XPath("//div[contains(@class, 'flw-item')]")
+NAV_ITEMS = lxml.etree.XPath("//*[contains(@class, 'nav-item')]")
+SEASON_LINKS = lxml.etree.XPath("//a[@href]")
+YEAR_SPANS = lxml.etree.XPath(".//span[contains(@class, 'fdi-item')]")
+ITEM_LINKS = lxml.etree.XPath(".//a[@href]")
+ITEM_IMGS = lxml.etree.XPath(".//img")
+_ID_RE = re.compile(r'-(\d+)$')
+_DOT_ID_RE = re.compile(r'\.(\d+)$')
 
 class LobsterApp:
     def __init__(self):
@@ -17,10 +45,38 @@ class LobsterApp:
         self.subs_language = "english"
         self.quality = "720"
         self.player = "mpv"
-        self.session = requests.Session()
+        self._provider_re = re.compile(re.escape(self.provider))
+        # Cache-first: repeat searches and season/episode listings are served
+        # from disk; decrypted video links expire quickly so keep their TTL short
+        self.session = requests_cache.CachedSession(
+            cache_name=os.path.expanduser('~/.cache/lobster'),
+            backend='sqlite',
+            expire_after=timedelta(hours=24),
+            allowable_methods=['GET'],
+            urls_expire_after={'dec.eatmynerds.live': 300}
+        )
+        # Sized keep-alive pool: the same two hosts are hit repeatedly, so
+        # reuse sockets instead of paying TCP+TLS setup on every call
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            # only advertise br when the decoder is present, otherwise servers
+            # honoring it hand us bodies requests can't decompress
+            'Accept-Encoding': 'br, gzip, deflate' if _HAVE_BROTLI else 'gzip, deflate',
+            'Connection': 'keep-alive'
         })
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+        self._episode_id_futures = {}
+        # Session-scoped memo of resolved server ids; replays skip the network
+        self._ep_id_cache = {}
+        self._movie_ep_id_cache = {}
     
     def notify(self, message, title=""):
         """Send notification to user"""
@@ -38,35 +94,39 @@ class LobsterApp:
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
+            tree = lxml.html.fromstring(response.content)
+
             results = []
-            items = soup.find_all('div', class_='flw-item')
-            
-            for item in items:
+
+            for item in SEARCH_ITEMS(tree):
                 try:
-                    img = item.find('img')
-                    link = item.find('a', href=True)
-                    title_elem = link.get('title') if link else None
-                    
-                    if not link or not title_elem:
+                    imgs = ITEM_IMGS(item)
+                    links = ITEM_LINKS(item)
+                    if not links:
+                        continue
+
+                    # Known schema: index attrib directly, malformed rows fall
+                    # through to the except and are skipped
+                    attrs = links[0].attrib
+                    href = attrs['href']
+                    title_elem = attrs['title']
+                    if not title_elem:
                         continue
-                    
-                    href = link['href']
+
                     media_type = 'tv' if '/tv/' in href else 'movie'
-                    media_id = re.search(r'-(\d+)$', href)
+                    media_id = _ID_RE.search(href)
                     media_id = media_id.group(1) if media_id else None
-                    
-                    year_elem = item.find('span', class_='fdi-item')
-                    year = year_elem.text if year_elem else 'N/A'
-                    
+
+                    year_spans = YEAR_SPANS(item)
+                    year = year_spans[0].text_content() if year_spans else 'N/A'
+
                     if media_id:
                         results.append({
                             'title': title_elem,
                             'id': media_id,
                             'type': media_type,
                             'year': year,
-                            'image': img.get('data-src', '') if img else ''
+                            'image': imgs[0].attrib.get('data-src', '') if imgs else ''
                         })
                 except Exception as e:
                     continue
@@ -108,14 +168,14 @@ class LobsterApp:
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
+            tree = lxml.html.fromstring(response.content)
+
             seasons = []
-            for link in soup.find_all('a', href=True):
-                season_id = re.search(r'-(\d+)$', link['href'])
+            for link in SEASON_LINKS(tree):
+                season_id = _ID_RE.search(link.get('href'))
                 if season_id:
                     seasons.append({
-                        'title': link.text.strip(),
+                        'title': link.text_content().strip(),
                         'id': season_id.group(1)
                     })
             return seasons
@@ -130,10 +190,10 @@ class LobsterApp:
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
+            tree = lxml.html.fromstring(response.content)
+
             episodes = []
-            for item in soup.find_all(class_='nav-item'):
+            for item in NAV_ITEMS(tree):
                 data_id = item.get('data-id')
                 title = item.get('title', '').strip()
                 if data_id:
@@ -148,44 +208,69 @@ class LobsterApp:
     
     def get_episode_id(self, data_id):
         """Get the episode streaming ID"""
+        if data_id in self._ep_id_cache:
+            return self._ep_id_cache[data_id]
+
         url = f"{self.base_url}/ajax/v2/episode/servers/{data_id}"
-        
+
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            for item in soup.find_all(class_='nav-item'):
+            tree = lxml.html.fromstring(response.content)
+
+            items = NAV_ITEMS(tree)
+            episode_id = None
+            for item in items:
                 title = item.get('title', '')
                 if self.provider in title:
-                    return item.get('data-id')
-            
-            # Fallback to first available
-            first_item = soup.find(class_='nav-item')
-            return first_item.get('data-id') if first_item else None
+                    episode_id = item.get('data-id')
+                    break
+            else:
+                # Fallback to first available
+                episode_id = items[0].get('data-id') if items else None
+
+            if episode_id:
+                self._ep_id_cache[data_id] = episode_id
+            return episode_id
         except Exception as e:
             self.notify(f"Error getting episode ID: {e}", "Error")
             return None
     
     def get_movie_episode_id(self, media_id):
         """Get episode ID for a movie"""
+        if media_id in self._movie_ep_id_cache:
+            return self._movie_ep_id_cache[media_id]
+
         url = f"{self.base_url}/ajax/movie/episodes/{media_id}"
-        
+
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            link = soup.find('a', href=True, title=re.compile(self.provider))
+            # Only anchors are consulted; skip building the rest of the tree
+            soup = BeautifulSoup(response.content, 'lxml',
+                                 parse_only=SoupStrainer('a', href=True))
+
+            link = soup.find('a', href=True, title=self._provider_re)
             if link:
                 href = link['href']
-                match = re.search(r'\.(\d+)$', href)
-                return match.group(1) if match else None
+                match = _DOT_ID_RE.search(href)
+                if match:
+                    self._movie_ep_id_cache[media_id] = match.group(1)
+                    return match.group(1)
             return None
         except Exception as e:
             self.notify(f"Error getting movie ID: {e}", "Error")
             return None
     
+    def _fetch_sources(self, data_id):
+        """Resolve an episode down to a playable link and subtitles"""
+        future = self._episode_id_futures.get(data_id)
+        episode_id = future.result() if future else self.get_episode_id(data_id)
+        if not episode_id:
+            self.notify("Could not get episode data", "Error")
+            return None, None
+        return self.get_video_link(episode_id)
+
     def get_video_link(self, episode_id):
         """Get the actual video streaming link"""
         # Get embed link
@@ -194,7 +279,7 @@ class LobsterApp:
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             embed_link = data.get('link', '')
             
             if not embed_link:
@@ -205,34 +290,27 @@ class LobsterApp:
             api_url = f"{self.api_url}/?url={embed_link}"
             response = self.session.get(api_url, timeout=15)
             response.raise_for_status()
-            video_data = response.json()
-            
-            # Extract video link
-            sources = video_data.get('sources', [])
-            video_link = None
-            for source in sources:
-                file_url = source.get('file', '')
-                if '.m3u8' in file_url:
-                    video_link = file_url
-                    break
+            video_data = _json_loads(response.content)
             
+            # Extract video link (first .m3u8 source wins)
+            video_link = next((s['file'] for s in video_data.get('sources', ())
+                               if '.m3u8' in s.get('file', '')), None)
+
             if not video_link:
                 self.notify("Could not extract video link", "Error")
                 return None, None
-            
-            # Apply quality settings
+
+            # Apply quality settings (literal substitution, no regex needed)
             if self.quality:
-                video_link = re.sub(r'/playlist\.m3u8', f'/{self.quality}/index.m3u8', video_link)
-            
+                video_link = video_link.replace('/playlist.m3u8',
+                                                f'/{self.quality}/index.m3u8', 1)
+
             # Extract subtitle links
-            subtitles = []
-            tracks = video_data.get('tracks', [])
-            for track in tracks:
-                if track.get('kind') == 'captions':
-                    label = track.get('label', '').lower()
-                    if self.subs_language.lower() in label:
-                        subtitles.append(track.get('file'))
-            
+            subs_language = self.subs_language.lower()
+            subtitles = [t['file'] for t in video_data.get('tracks', ())
+                         if t.get('kind') == 'captions'
+                         and subs_language in t.get('label', '').lower()]
+
             return video_link, subtitles
             
         except Exception as e:
@@ -240,27 +318,29 @@ class LobsterApp:
             return None, None
     
     def play_video(self, video_url, subtitle_urls, title):
-        """Play video using media player"""
+        """Start the media player; returns the process so callers can wait"""
         self.notify(f"Now playing: {title}")
-        
+
         if not video_url:
             self.notify("No video URL provided", "Error")
-            return
-        
+            return None
+
         # Build mpv command - use = for options with values
         cmd = [self.player, video_url]
         cmd.append(f'--force-media-title={title}')
-        
+
         if subtitle_urls:
             for sub_url in subtitle_urls:
                 cmd.append(f'--sub-file={sub_url}')
-        
+
         try:
-            subprocess.run(cmd, check=False)
+            # Popen so prefetch threads keep working while the player runs
+            return subprocess.Popen(cmd)
         except FileNotFoundError:
             self.notify(f"Player '{self.player}' not found. Please install it.", "Error")
         except Exception as e:
             self.notify(f"Error playing video: {e}", "Error")
+        return None
     
     def handle_movie(self, media):
         """Handle movie playback"""
@@ -271,7 +351,9 @@ class LobsterApp:
         
         video_url, subtitles = self.get_video_link(episode_id)
         if video_url:
-            self.play_video(video_url, subtitles, media['title'])
+            proc = self.play_video(video_url, subtitles, media['title'])
+            if proc:
+                proc.wait()
     
     def handle_tv_show(self, media):
         """Handle TV show playback"""
@@ -281,32 +363,57 @@ class LobsterApp:
             self.notify("No seasons found", "Error")
             return
         
+        # Warm every season's episode list so any pick resolves instantly
+        season_futures = {
+            s['id']: self._io_pool.submit(self.get_episodes, s['id'])
+            for s in seasons
+        }
+
         season = self.select_from_list(seasons, "Select Season")
         if not season:
             return
-        
+
         # Get episodes
-        episodes = self.get_episodes(season['id'])
+        episodes = season_futures[season['id']].result()
         if not episodes:
             self.notify("No episodes found", "Error")
             return
-        
+
+        # Warm episode IDs concurrently so selection is instant
+        self._episode_id_futures = {
+            ep['data_id']: self._io_pool.submit(self.get_episode_id, ep['data_id'])
+            for ep in episodes
+        }
+
+        sources_futures = {}
+
         while True:
             episode = self.select_from_list(episodes, "Select Episode")
             if not episode:
                 return
-            
-            # Get episode ID
-            episode_id = self.get_episode_id(episode['data_id'])
-            if not episode_id:
-                self.notify("Could not get episode data", "Error")
-                continue
-            
-            video_url, subtitles = self.get_video_link(episode_id)
+
+            # Use prefetched sources if this pick was warmed during playback
+            future = sources_futures.pop(episode['data_id'], None)
+            if future:
+                video_url, subtitles = future.result()
+            else:
+                video_url, subtitles = self._fetch_sources(episode['data_id'])
+
             if video_url:
                 title = f"{media['title']} - {season['title']} - {episode['title']}"
-                self.play_video(video_url, subtitles, title)
-                
+
+                # Warm the next episode's sources while this one plays
+                next_idx = episodes.index(episode) + 1
+                if next_idx < len(episodes):
+                    next_id = episodes[next_idx]['data_id']
+                    if next_id not in sources_futures:
+                        sources_futures[next_id] = self._io_pool.submit(
+                            self._fetch_sources, next_id)
+
+                proc = self.play_video(video_url, subtitles, title)
+                if proc:
+                    proc.wait()
+
                 # Ask to continue
                 choice = input("\nPlay next episode? (y/n): ").strip().lower()
                 if choice != 'y':
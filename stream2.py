@@ -9,24 +9,74 @@ import os
 import sys
 import re
 import json
+import shutil
 import subprocess
 import time
 import logging
+import importlib.util
+import concurrent.futures
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 from urllib.parse import quote
 
-try:
-    import requests
-    from requests.adapters import HTTPAdapter
-    from requests.packages.urllib3.util.retry import Retry
-    from bs4 import BeautifulSoup
-except ImportError as e:
-    print(f"Error: Missing required package - {e}")
+# Check availability without paying the import cost: a session that only
+# touches the menus or settings never needs requests/bs4 loaded at all
+if importlib.util.find_spec('requests') is None or importlib.util.find_spec('bs4') is None:
+    print("Error: Missing required package - requests or beautifulsoup4")
     print("\nPlease install required packages:")
     print("  pip install requests beautifulsoup4")
     sys.exit(1)
 
+# Bound by _import_heavy() on first network use
+requests = None
+requests_cache = None
+BeautifulSoup = None
+SoupStrainer = None
+HTTPAdapter = None
+Retry = None
+_FLW_ITEM = None
+_NAV_ITEM = None
+_A_HREF = None
+
+
+def _import_heavy():
+    """Import requests/bs4 and build the parse strainers on first use"""
+    global requests, requests_cache, BeautifulSoup, SoupStrainer
+    global HTTPAdapter, Retry, _FLW_ITEM, _NAV_ITEM, _A_HREF
+    if requests is not None:
+        return
+    import requests as _requests
+    from requests.adapters import HTTPAdapter as _HTTPAdapter
+    from requests.packages.urllib3.util.retry import Retry as _Retry
+    from bs4 import BeautifulSoup as _BeautifulSoup, SoupStrainer as _SoupStrainer
+    try:
+        # Optional on-disk HTTP cache; falls back to a plain session if missing
+        import requests_cache as _requests_cache
+    except ImportError:
+        _requests_cache = None
+    HTTPAdapter, Retry = _HTTPAdapter, _Retry
+    BeautifulSoup, SoupStrainer = _BeautifulSoup, _SoupStrainer
+    requests_cache = _requests_cache
+    # Strainers for the bs4 fallback: only these nodes are ever consulted,
+    # so skip building the rest of the tree
+    _FLW_ITEM = _SoupStrainer('div', class_='flw-item')
+    _NAV_ITEM = _SoupStrainer(class_='nav-item')
+    _A_HREF = _SoupStrainer('a', href=True)
+    requests = _requests
+
+
+try:
+    # Lexbor is ~10-20x faster than bs4 for these simple selector lookups
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # Optional C JSON codec, 2-5x faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +88,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Media ids are embedded in hrefs as "...-123" or "....123"; compiled once
+_ID_DASH_RE = re.compile(r'-(\d+)$')
+_ID_DOT_RE = re.compile(r'\.(\d+)$')
+_PLAYLIST_RE = re.compile(r'/playlist\.m3u8')
+# Raw-bytes scan for server nav items; skips DOM construction on the per-episode path
+_NAV_RE = re.compile(
+    rb'<[^>]+class="[^"]*nav-item[^"]*"[^>]*data-id="(\d+)"[^>]*title="([^"]*)"',
+    re.IGNORECASE,
+)
+
+def _css_all(node, selector):
+    """Select all matching nodes (Lexbor tree or bs4 soup)"""
+    return node.css(selector) if LexborHTMLParser else node.select(selector)
+
+
+def _css_first(node, selector):
+    """Select the first matching node, or None"""
+    return node.css_first(selector) if LexborHTMLParser else node.select_one(selector)
+
+
+def _attr(node, name, default=None):
+    """Read an attribute from a Lexbor or bs4 node"""
+    attrs = node.attributes if LexborHTMLParser else node.attrs
+    value = attrs.get(name, default)
+    return value if value is not None else default
+
+
+def _node_text(node):
+    """Stripped text content of a Lexbor or bs4 node"""
+    return node.text(strip=True) if LexborHTMLParser else node.get_text(strip=True)
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -52,8 +133,16 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# Banners rebuilt on every menu render otherwise; compute them once
+_SEP = f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}"
+_SEP_PLAIN = f"{Colors.HEADER}{'=' * 60}{Colors.ENDC}"
+
+
 class ConfigManager:
     """Manage application configuration"""
+
+    __slots__ = ('config_dir', 'config_file', 'history_file', 'config')
+
     def __init__(self):
         self.config_dir = Path.home() / '.config' / 'lobster2'
         self.config_file = self.config_dir / 'config.json'
@@ -76,9 +165,10 @@ class ConfigManager:
         
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    user_config = json.load(f)
-                    default_config.update(user_config)
+                with open(self.config_file, 'rb') as f:
+                    raw = f.read()
+                user_config = orjson.loads(raw) if orjson else json.loads(raw)
+                default_config.update(user_config)
             except Exception as e:
                 logger.warning(f"Could not load config: {e}. Using defaults.")
         
@@ -87,8 +177,12 @@ class ConfigManager:
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if orjson:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_file, 'w') as f:
+                    json.dump(self.config, f, indent=2)
         except Exception as e:
             logger.error(f"Could not save config: {e}")
     
@@ -104,18 +198,56 @@ class ConfigManager:
 
 class LobsterApp:
     """Main application class"""
+
+    __slots__ = ('config', '_session', 'current_media', 'current_season',
+                 'current_episode', '_pool', '_player_ok', '_cached_player',
+                 '_embed_cache')
+
+    COLOR_MAP = {
+        "INFO": Colors.OKBLUE,
+        "SUCCESS": Colors.OKGREEN,
+        "WARNING": Colors.WARNING,
+        "ERROR": Colors.FAIL
+    }
     
     def __init__(self):
         self.config = ConfigManager()
-        self.session = self._create_session()
+        self._session = None
         self.current_media = None
         self.current_season = None
         self.current_episode = None
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self._player_ok: Optional[bool] = None
+        self._cached_player: Optional[str] = None
+        self._embed_cache: Dict[str, str] = {}
         
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic"""
-        session = requests.Session()
-        
+    @property
+    def session(self) -> "requests.Session":
+        """The HTTP session, built lazily on first network use"""
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> "requests.Session":
+        """Create a requests session with retry logic and on-disk caching"""
+        _import_heavy()
+        if requests_cache:
+            session = requests_cache.CachedSession(
+                cache_name=str(Path.home() / '.cache' / 'lobster2'),
+                backend='sqlite',
+                expire_after=86400,
+                allowable_methods=['GET']
+            )
+            # Season/episode listings are stable for days; the sources and
+            # decrypt endpoints hand out short-lived links, so never cache them
+            session.settings.urls_expire_after = {
+                '*/ajax/episode/sources/*': 0,
+                'dec.eatmynerds.live*': 0,
+            }
+        else:
+            logger.debug("requests-cache not installed; skipping HTTP cache")
+            session = requests.Session()
+
         # Configure retry strategy
         retry_strategy = Retry(
             total=3,
@@ -124,7 +256,14 @@ class LobsterApp:
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Oversized pool so flixhq, the decrypt API and subtitle hosts all
+        # keep their sockets alive instead of evicting each other
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=50,
+            pool_maxsize=50,
+            pool_block=False
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -143,14 +282,7 @@ class LobsterApp:
     
     def notify(self, message: str, level: str = "INFO", title: str = ""):
         """Send notification to user with color coding"""
-        color_map = {
-            "INFO": Colors.OKBLUE,
-            "SUCCESS": Colors.OKGREEN,
-            "WARNING": Colors.WARNING,
-            "ERROR": Colors.FAIL
-        }
-        
-        color = color_map.get(level, Colors.ENDC)
+        color = self.COLOR_MAP.get(level, Colors.ENDC)
         prefix = f"[{title}] " if title else ""
         print(f"\n{color}{Colors.BOLD}{prefix}{message}{Colors.ENDC}")
         
@@ -158,61 +290,80 @@ class LobsterApp:
         log_func = getattr(logger, level.lower(), logger.info)
         log_func(f"{prefix}{message}")
     
+    def _parse(self, response, strainer: Optional["SoupStrainer"] = None):
+        """Parse a response body with the fastest available HTML parser
+
+        The strainer only applies on the bs4 fallback path; Lexbor builds
+        its tree in C where the full parse is already cheap.
+        """
+        if LexborHTMLParser:
+            return LexborHTMLParser(response.content)
+        return BeautifulSoup(response.content, 'lxml', parse_only=strainer)
+
     def check_player(self) -> bool:
-        """Check if the media player is available"""
+        """Check if the media player is available (cached per player name)"""
         player = self.config.get('player')
-        try:
-            result = subprocess.run(
-                [player, '--version'],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        if self._player_ok is not None and player == self._cached_player:
+            return self._player_ok
+
+        self._cached_player = player
+        if shutil.which(player):
+            # A PATH hit is enough; no need to spawn the player
+            self._player_ok = True
+        else:
+            try:
+                result = subprocess.run(
+                    [player, '--version'],
+                    capture_output=True,
+                    timeout=5
+                )
+                self._player_ok = result.returncode == 0
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                self._player_ok = False
+        return self._player_ok
     
     def search(self, query: str) -> List[Dict]:
         """Search for movies/TV shows"""
         self.notify(f"Searching for: {query}", "INFO")
         search_query = query.replace(' ', '-')
-        url = f"{self.config.get('base_url')}/search/{search_query}"
+        url = f"{self.config.config['base_url']}/search/{search_query}"
         
         try:
             response = self.session.get(url, timeout=(5, 10))
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._parse(response, _FLW_ITEM)
             
             results = []
-            items = soup.find_all('div', class_='flw-item')
-            
+            items = _css_all(soup, 'div.flw-item')
+
             if not items:
                 self.notify("No results found", "WARNING")
                 return []
-            
+
             for item in items:
                 try:
-                    img = item.find('img')
-                    link = item.find('a', href=True)
-                    title_elem = link.get('title') if link else None
-                    
+                    img = _css_first(item, 'img')
+                    link = _css_first(item, 'a[href]')
+                    title_elem = _attr(link, 'title') if link else None
+
                     if not link or not title_elem:
                         continue
-                    
-                    href = link['href']
+
+                    href = _attr(link, 'href')
                     media_type = 'tv' if '/tv/' in href else 'movie'
-                    media_id = re.search(r'-(\d+)$', href)
+                    media_id = _ID_DASH_RE.search(href)
                     media_id = media_id.group(1) if media_id else None
-                    
-                    year_elem = item.find('span', class_='fdi-item')
-                    year = year_elem.text.strip() if year_elem else 'N/A'
-                    
+
+                    year_elem = _css_first(item, 'span.fdi-item')
+                    year = _node_text(year_elem) if year_elem else 'N/A'
+
                     if media_id:
                         results.append({
                             'title': title_elem,
                             'id': media_id,
                             'type': media_type,
                             'year': year,
-                            'image': img.get('data-src', '') if img else ''
+                            'image': _attr(img, 'data-src', '') if img else ''
                         })
                 except Exception as e:
                     logger.debug(f"Error parsing item: {e}")
@@ -234,10 +385,10 @@ class LobsterApp:
         if not items:
             return None
         
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{prompt}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-        
+        buf = [f"\n{_SEP}",
+               f"{Colors.HEADER}{Colors.BOLD}{prompt}{Colors.ENDC}",
+               _SEP]
+
         for idx, item in enumerate(items, 1):
             if isinstance(item, dict):
                 if display_key:
@@ -246,10 +397,12 @@ class LobsterApp:
                     display = f"{item.get('title', item)} ({item.get('type', '')}) [{item.get('year', '')}]"
             else:
                 display = str(item)
-            
-            print(f"{Colors.OKCYAN}  {idx:2d}.{Colors.ENDC} {display}")
-        
-        print(f"\n{Colors.WARNING}Enter number, 'b' to go back, or 'q' to quit{Colors.ENDC}")
+
+            buf.append(f"{Colors.OKCYAN}  {idx:2d}.{Colors.ENDC} {display}")
+
+        buf.append(f"\n{Colors.WARNING}Enter number, 'b' to go back, or 'q' to quit{Colors.ENDC}")
+        # One write per render instead of a syscall per line; helps over slow TTYs
+        sys.stdout.write('\n'.join(buf) + '\n')
         
         while True:
             try:
@@ -275,19 +428,19 @@ class LobsterApp:
     
     def get_seasons(self, media_id: str) -> List[Dict]:
         """Get available seasons for a TV show"""
-        url = f"{self.config.get('base_url')}/ajax/v2/tv/seasons/{media_id}"
+        url = f"{self.config.config['base_url']}/ajax/v2/tv/seasons/{media_id}"
         
         try:
             response = self.session.get(url, timeout=(3, 10))
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._parse(response, _A_HREF)
             
             seasons = []
-            for link in soup.find_all('a', href=True):
-                season_id = re.search(r'-(\d+)$', link['href'])
+            for link in _css_all(soup, 'a[href]'):
+                season_id = _ID_DASH_RE.search(_attr(link, 'href', ''))
                 if season_id:
                     seasons.append({
-                        'title': link.text.strip(),
+                        'title': _node_text(link),
                         'id': season_id.group(1)
                     })
             
@@ -304,17 +457,17 @@ class LobsterApp:
     
     def get_episodes(self, season_id: str) -> List[Dict]:
         """Get episodes for a season"""
-        url = f"{self.config.get('base_url')}/ajax/v2/season/episodes/{season_id}"
+        url = f"{self.config.config['base_url']}/ajax/v2/season/episodes/{season_id}"
         
         try:
             response = self.session.get(url, timeout=(3, 10))
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._parse(response, _NAV_ITEM)
             
             episodes = []
-            for item in soup.find_all(class_='nav-item'):
-                data_id = item.get('data-id')
-                title = item.get('title', '').strip()
+            for item in _css_all(soup, '.nav-item'):
+                data_id = _attr(item, 'data-id')
+                title = _attr(item, 'title', '').strip()
                 if data_id:
                     episodes.append({
                         'title': title,
@@ -334,26 +487,38 @@ class LobsterApp:
     
     def get_episode_id(self, data_id: str) -> Optional[str]:
         """Get the episode streaming ID"""
-        url = f"{self.config.get('base_url')}/ajax/v2/episode/servers/{data_id}"
-        provider = self.config.get('provider')
+        cfg = self.config.config
+        url = f"{cfg['base_url']}/ajax/v2/episode/servers/{data_id}"
+        provider = cfg.get('provider', '')
         
         try:
             response = self.session.get(url, timeout=(3, 10))
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
+
+            # Fast path: a regex scan over the raw body avoids building a DOM
+            matches = _NAV_RE.findall(response.content)
+            if matches:
+                wanted = provider.encode().lower()
+                for did, title in matches:
+                    if wanted in title.lower():
+                        return did.decode()
+                self.notify(f"Using fallback provider", "WARNING")
+                return matches[0][0].decode()
+
+            soup = self._parse(response, _NAV_ITEM)
+
             # Try to find preferred provider
-            for item in soup.find_all(class_='nav-item'):
-                title = item.get('title', '')
+            items = _css_all(soup, '.nav-item')
+            for item in items:
+                title = _attr(item, 'title', '')
                 if provider in title:
-                    return item.get('data-id')
-            
+                    return _attr(item, 'data-id')
+
             # Fallback to first available
-            first_item = soup.find(class_='nav-item')
-            if first_item:
+            if items:
                 self.notify(f"Using fallback provider", "WARNING")
-                return first_item.get('data-id')
-            
+                return _attr(items[0], 'data-id')
+
             return None
             
         except requests.Timeout:
@@ -365,29 +530,29 @@ class LobsterApp:
     
     def get_movie_episode_id(self, media_id: str) -> Optional[str]:
         """Get episode ID for a movie"""
-        url = f"{self.config.get('base_url')}/ajax/movie/episodes/{media_id}"
-        provider = self.config.get('provider')
+        cfg = self.config.config
+        url = f"{cfg['base_url']}/ajax/movie/episodes/{media_id}"
+        provider = cfg.get('provider', '')
         
         try:
             response = self.session.get(url, timeout=(3, 10))
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            link = soup.find('a', href=True, title=re.compile(provider, re.IGNORECASE))
-            if link:
-                href = link['href']
-                match = re.search(r'\.(\d+)$', href)
-                return match.group(1) if match else None
-            
+            soup = self._parse(response, _A_HREF)
+            
+            links = _css_all(soup, 'a[href]')
+            provider_lower = provider.lower()
+            for link in links:
+                if provider_lower in _attr(link, 'title', '').lower():
+                    match = _ID_DOT_RE.search(_attr(link, 'href', ''))
+                    return match.group(1) if match else None
+
             # Try any available link
-            link = soup.find('a', href=True)
-            if link:
-                href = link['href']
-                match = re.search(r'\.(\d+)$', href)
+            if links:
+                match = _ID_DOT_RE.search(_attr(links[0], 'href', ''))
                 if match:
                     self.notify("Using fallback provider", "WARNING")
                     return match.group(1)
-            
+
             return None
             
         except requests.Timeout:
@@ -399,28 +564,52 @@ class LobsterApp:
     
     def get_video_link(self, episode_id: str) -> Tuple[Optional[str], List[str]]:
         """Get the actual video streaming link"""
+        # Hoist config lookups out of the hot path
+        cfg = self.config.config
+        quality = cfg.get('quality')
+        subs_language = cfg.get('subs_language', '').lower()
+
         # Get embed link
-        url = f"{self.config.get('base_url')}/ajax/episode/sources/{episode_id}"
-        
+        url = f"{cfg['base_url']}/ajax/episode/sources/{episode_id}"
+
         try:
-            # Get embed link with timeout
-            response = self.session.get(url, timeout=(5, 10))
-            response.raise_for_status()
-            data = response.json()
-            embed_link = data.get('link', '')
-            
-            if not embed_link:
-                self.notify("Could not get embed link", "ERROR")
-                return None, []
-            
-            self.notify("Extracting video link...", "INFO")
-            
-            # Decrypt and get video link with longer timeout for API
-            api_url = f"{self.config.get('api_url')}/?url={embed_link}"
-            response = self.session.get(api_url, timeout=(10, 20))
-            response.raise_for_status()
-            video_data = response.json()
-            
+            # Fast path: ask the decrypt API for the episode id directly; if
+            # the deployment supports it, the embed round trip is skipped
+            video_data = None
+            try:
+                direct_url = f"{cfg['api_url']}/?id={episode_id}&provider={cfg.get('provider', '')}"
+                with self.session.get(direct_url, timeout=(3, 5), stream=True) as response:
+                    if response.status_code == 200:
+                        payload = orjson.loads(response.content) if orjson else response.json()
+                        if payload.get('sources'):
+                            video_data = payload
+            except (requests.RequestException, ValueError):
+                logger.debug("Direct decrypt fast path unavailable; using embed flow")
+
+            if video_data is None:
+                # Embed links are stable per episode; replays skip this fetch
+                embed_link = self._embed_cache.get(episode_id)
+                if not embed_link:
+                    # Get embed link with timeout; stream so the body isn't
+                    # buffered ahead of the JSON parse
+                    with self.session.get(url, timeout=(5, 10), stream=True) as response:
+                        response.raise_for_status()
+                        data = orjson.loads(response.content) if orjson else response.json()
+                    embed_link = data.get('link', '')
+
+                    if not embed_link:
+                        self.notify("Could not get embed link", "ERROR")
+                        return None, []
+                    self._embed_cache[episode_id] = embed_link
+
+                self.notify("Extracting video link...", "INFO")
+
+                # Decrypt and get video link with longer timeout for API
+                api_url = f"{cfg['api_url']}/?url={embed_link}"
+                with self.session.get(api_url, timeout=(10, 20), stream=True) as response:
+                    response.raise_for_status()
+                    video_data = orjson.loads(response.content) if orjson else response.json()
+
             # Extract video link
             sources = video_data.get('sources', [])
             video_link = None
@@ -436,19 +625,17 @@ class LobsterApp:
                 return None, []
             
             # Apply quality settings
-            quality = self.config.get('quality')
             if quality:
-                video_link = re.sub(r'/playlist\.m3u8', f'/{quality}/index.m3u8', video_link)
+                video_link = _PLAYLIST_RE.sub(f'/{quality}/index.m3u8', video_link)
             
             # Extract subtitle links
             subtitles = []
-            subs_language = self.config.get('subs_language')
             tracks = video_data.get('tracks', [])
-            
+
             for track in tracks:
                 if track.get('kind') == 'captions':
                     label = track.get('label', '').lower()
-                    if subs_language.lower() in label:
+                    if subs_language in label:
                         sub_url = track.get('file')
                         if sub_url:
                             subtitles.append(sub_url)
@@ -470,11 +657,12 @@ class LobsterApp:
             self.notify("Invalid response from server", "ERROR")
             return None, []
     
-    def play_video(self, video_url: str, subtitle_urls: List[str], title: str):
-        """Play video using media player"""
+    def play_video(self, video_url: str, subtitle_urls: List[str],
+                   title: str) -> Optional[subprocess.Popen]:
+        """Start the media player; returns the process so callers can wait"""
         if not video_url:
             self.notify("No video URL provided", "ERROR")
-            return
+            return None
         
         player = self.config.get('player')
         
@@ -482,7 +670,7 @@ class LobsterApp:
         if not self.check_player():
             self.notify(f"Player '{player}' not found. Please install it.", "ERROR")
             self.notify("Install mpv: https://mpv.io/installation/", "INFO")
-            return
+            return None
         
         self.notify(f"Now playing: {title}", "SUCCESS", "Media Player")
         
@@ -498,23 +686,34 @@ class LobsterApp:
                 cmd.append(f'--sub-file={sub_url}')
         
         try:
-            # Run player
-            process = subprocess.run(
+            # Start player without blocking so prefetch work can overlap
+            return subprocess.Popen(
                 cmd,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
-            
-            if process.returncode != 0 and process.returncode != 4:  # 4 is normal mpv quit
-                self.notify("Player exited with an error", "WARNING")
-                
         except FileNotFoundError:
             self.notify(f"Player '{player}' not found. Please install it.", "ERROR")
-        except KeyboardInterrupt:
-            self.notify("Playback interrupted", "WARNING")
         except Exception as e:
             self.notify(f"Error playing video: {e}", "ERROR")
-    
+        return None
+
+    def _wait_player(self, process: subprocess.Popen):
+        """Wait for the player to exit, reporting abnormal exits"""
+        try:
+            returncode = process.wait()
+            if returncode != 0 and returncode != 4:  # 4 is normal mpv quit
+                self.notify("Player exited with an error", "WARNING")
+        except KeyboardInterrupt:
+            self.notify("Playback interrupted", "WARNING")
+
+    def _resolve_episode(self, episode: Dict) -> Tuple[Optional[str], List[str]]:
+        """Resolve an episode down to its playable link and subtitles"""
+        episode_id = self.get_episode_id(episode['data_id'])
+        if not episode_id:
+            return None, []
+        return self.get_video_link(episode_id)
+
     def handle_movie(self, media: Dict):
         """Handle movie playback"""
         self.current_media = media
@@ -526,7 +725,9 @@ class LobsterApp:
         
         video_url, subtitles = self.get_video_link(episode_id)
         if video_url:
-            self.play_video(video_url, subtitles, media['title'])
+            process = self.play_video(video_url, subtitles, media['title'])
+            if process:
+                self._wait_player(process)
         else:
             self.notify("Failed to get video link", "ERROR")
     
@@ -539,7 +740,14 @@ class LobsterApp:
         if not seasons:
             self.notify("No seasons found", "ERROR")
             return
-        
+
+        # Episode lists for different seasons are independent fetches; warm
+        # them all concurrently so whichever season is picked is ready
+        season_futures = {
+            s['id']: self._pool.submit(self.get_episodes, s['id'])
+            for s in seasons
+        }
+
         while True:
             season = self.select_from_list(
                 seasons, 
@@ -551,14 +759,18 @@ class LobsterApp:
             
             self.current_season = season
             
-            # Get episodes
-            episodes = self.get_episodes(season['id'])
+            # Get episodes (usually already prefetched)
+            episodes = season_futures[season['id']].result()
             if not episodes:
                 self.notify("No episodes found", "ERROR")
+                # Resubmit so re-picking this season retries the fetch
+                season_futures[season['id']] = self._pool.submit(
+                    self.get_episodes, season['id'])
                 continue
             
             # Episode playback loop
             current_episode_idx = 0
+            prefetched = {}
             while current_episode_idx < len(episodes):
                 episode = episodes[current_episode_idx]
                 
@@ -575,32 +787,38 @@ class LobsterApp:
                     current_episode_idx = episodes.index(episode)
                 
                 self.current_episode = episode
-                
-                # Get episode ID
-                episode_id = self.get_episode_id(episode['data_id'])
-                if not episode_id:
-                    self.notify("Could not get episode data", "ERROR")
-                    current_episode_idx += 1
-                    continue
-                
-                # Get and play video
-                video_url, subtitles = self.get_video_link(episode_id)
+
+                # Resolve the link, preferring a prefetched result
+                future = prefetched.pop(episode['data_id'], None)
+                if future:
+                    video_url, subtitles = future.result()
+                else:
+                    video_url, subtitles = self._resolve_episode(episode)
+
                 if video_url:
                     title = f"{media['title']} - {season['title']} - {episode['title']}"
-                    self.play_video(video_url, subtitles, title)
+                    process = self.play_video(video_url, subtitles, title)
+                    if process:
+                        # Warm the next episode's link while this one plays
+                        if current_episode_idx < len(episodes) - 1:
+                            next_ep = episodes[current_episode_idx + 1]
+                            if next_ep['data_id'] not in prefetched:
+                                prefetched[next_ep['data_id']] = self._pool.submit(
+                                    self._resolve_episode, next_ep)
+                        self._wait_player(process)
                 else:
                     self.notify("Failed to get video link", "ERROR")
                 
                 # Ask what to do next
                 if current_episode_idx < len(episodes) - 1:
-                    print(f"\n{Colors.HEADER}{'=' * 60}{Colors.ENDC}")
+                    print(f"\n{_SEP_PLAIN}")
                     print(f"{Colors.OKCYAN}1.{Colors.ENDC} Play next episode")
                     print(f"{Colors.OKCYAN}2.{Colors.ENDC} Replay current episode")
                     print(f"{Colors.OKCYAN}3.{Colors.ENDC} Choose another episode")
                     print(f"{Colors.OKCYAN}4.{Colors.ENDC} Back to season selection")
                     print(f"{Colors.OKCYAN}5.{Colors.ENDC} New search")
                     print(f"{Colors.OKCYAN}q.{Colors.ENDC} Quit")
-                    print(f"{Colors.HEADER}{'=' * 60}{Colors.ENDC}")
+                    print(_SEP_PLAIN)
                     
                     choice = input(f"\n{Colors.BOLD}Your choice: {Colors.ENDC}").strip().lower()
                     
@@ -625,10 +843,10 @@ class LobsterApp:
     def show_settings(self):
         """Display and modify settings"""
         while True:
-            print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-            print(f"{Colors.HEADER}{Colors.BOLD}Settings{Colors.ENDC}")
-            print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-            
+            buf = [f"\n{_SEP}",
+                   f"{Colors.HEADER}{Colors.BOLD}Settings{Colors.ENDC}",
+                   _SEP]
+
             settings = [
                 ('provider', 'Video Provider'),
                 ('quality', 'Video Quality'),
@@ -636,12 +854,13 @@ class LobsterApp:
                 ('player', 'Media Player'),
                 ('auto_next', 'Auto Play Next Episode'),
             ]
-            
+
             for idx, (key, label) in enumerate(settings, 1):
                 value = self.config.get(key)
-                print(f"{Colors.OKCYAN}{idx}.{Colors.ENDC} {label}: {Colors.BOLD}{value}{Colors.ENDC}")
-            
-            print(f"{Colors.OKCYAN}b.{Colors.ENDC} Back to main menu")
+                buf.append(f"{Colors.OKCYAN}{idx}.{Colors.ENDC} {label}: {Colors.BOLD}{value}{Colors.ENDC}")
+
+            buf.append(f"{Colors.OKCYAN}b.{Colors.ENDC} Back to main menu")
+            sys.stdout.write('\n'.join(buf) + '\n')
             
             choice = input(f"\n{Colors.BOLD}Select setting to change: {Colors.ENDC}").strip().lower()
             
@@ -668,25 +887,29 @@ class LobsterApp:
     
     def show_main_menu(self):
         """Display main menu"""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}🦞 Lobster - Movie & TV Show Streaming{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-        print(f"{Colors.OKCYAN}1.{Colors.ENDC} Search for Movie/TV Show")
-        print(f"{Colors.OKCYAN}2.{Colors.ENDC} Settings")
-        print(f"{Colors.OKCYAN}3.{Colors.ENDC} About")
-        print(f"{Colors.OKCYAN}q.{Colors.ENDC} Quit")
-        print(f"{Colors.HEADER}{'=' * 60}{Colors.ENDC}")
+        sys.stdout.write('\n'.join((
+            f"\n{_SEP}",
+            f"{Colors.HEADER}{Colors.BOLD}🦞 Lobster - Movie & TV Show Streaming{Colors.ENDC}",
+            _SEP,
+            f"{Colors.OKCYAN}1.{Colors.ENDC} Search for Movie/TV Show",
+            f"{Colors.OKCYAN}2.{Colors.ENDC} Settings",
+            f"{Colors.OKCYAN}3.{Colors.ENDC} About",
+            f"{Colors.OKCYAN}q.{Colors.ENDC} Quit",
+            _SEP_PLAIN,
+        )) + '\n')
     
     def show_about(self):
         """Display about information"""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}About Lobster{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-        print(f"\n{Colors.OKGREEN}Version:{Colors.ENDC} 2.0")
-        print(f"{Colors.OKGREEN}Description:{Colors.ENDC} A Python-based movie and TV show streaming application")
-        print(f"{Colors.OKGREEN}Original:{Colors.ENDC} Based on lobster shell script by justchokingaround")
-        print(f"{Colors.OKGREEN}Requirements:{Colors.ENDC} mpv (media player), requests, beautifulsoup4")
-        print(f"\n{Colors.WARNING}Note:{Colors.ENDC} Use responsibly and according to your local laws.")
+        sys.stdout.write('\n'.join((
+            f"\n{_SEP}",
+            f"{Colors.HEADER}{Colors.BOLD}About Lobster{Colors.ENDC}",
+            _SEP,
+            f"\n{Colors.OKGREEN}Version:{Colors.ENDC} 2.0",
+            f"{Colors.OKGREEN}Description:{Colors.ENDC} A Python-based movie and TV show streaming application",
+            f"{Colors.OKGREEN}Original:{Colors.ENDC} Based on lobster shell script by justchokingaround",
+            f"{Colors.OKGREEN}Requirements:{Colors.ENDC} mpv (media player), requests, beautifulsoup4",
+            f"\n{Colors.WARNING}Note:{Colors.ENDC} Use responsibly and according to your local laws.",
+        )) + '\n')
         input(f"\n{Colors.BOLD}Press Enter to continue...{Colors.ENDC}")
     
     def run(self):
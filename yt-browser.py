@@ -15,6 +15,8 @@ import platform
 import urllib.parse
 import re
 import shlex
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # ==========================================
 # GLOBAL VARIABLES & CONFIGURATION
@@ -89,6 +91,19 @@ CONFIG = {
     "AUTO_LOADED_EXTENSIONS": ""
 }
 
+# Typed views of CONFIG, refreshed by load_config(); hot paths read these
+# instead of re-coercing the raw strings on every iteration
+CONFIG_INT = {}
+CONFIG_BOOL = {}
+
+def _refresh_typed_config():
+    for key in ("NO_OF_SEARCH_RESULTS", "NOTIFICATION_DURATION", "NO_OF_RECENT"):
+        CONFIG_INT[key] = int(CONFIG[key])
+    for key in ("PRETTY_PRINT", "ENABLE_PREVIEW", "UPDATE_RECENT", "SEARCH_HISTORY",
+                "DISOWN_STREAMING_PROCESS", "WELCOME_SCREEN"):
+        CONFIG_BOOL[key] = CONFIG[key] == "true"
+    CONFIG_BOOL["FZF"] = CONFIG["PREFERRED_SELECTOR"] == "fzf"
+
 # Global State
 PLAYLIST_START = 1
 PLAYLIST_END = 30
@@ -101,10 +116,39 @@ CYAN = ""
 BOLD = ""
 RESET = ""
 
+# Patterns used inside the interactive loops, compiled once at import so the
+# per-selection cost is a direct Pattern.sub/match dispatch
+_RE_LEADING_NUM = re.compile(r'^[0-9]+ ')
+_RE_HIST_BANG = re.compile(r'^![0-9]{1,2}$')
+_RE_FILTER_CMD = re.compile(r'^(:[a-z]+)\s+(.+)')
+
+def _strip_num_prefix(s):
+    # The "NN " prefix is produced by our own enumerator, so a partition +
+    # isdigit check replaces the regex at a fraction of the cost
+    head, sep, tail = s.partition(' ')
+    return tail if sep and head.isdigit() else s
+
 # ==========================================
 # HELPER FUNCTIONS
 # ==========================================
 
+def _missing_or_empty(path):
+    # one stat() instead of the exists() + getsize() pair
+    try:
+        return os.stat(path).st_size == 0
+    except OSError:
+        return True
+
+# Resolved on first use; shutil.which walks every $PATH entry and the
+# opener cannot change mid-session
+_OPENER = None
+
+def _get_opener():
+    global _OPENER
+    if _OPENER is None:
+        _OPENER = shutil.which("open") or shutil.which("xdg-open") or ""
+    return _OPENER
+
 def generate_sha256(text):
     if text is None:
         text = ""
@@ -114,7 +158,7 @@ def generate_sha256(text):
 
 def send_notification(message):
     sys.stderr.write(f"{message}\n")
-    time.sleep(int(CONFIG["NOTIFICATION_DURATION"]))
+    time.sleep(CONFIG_INT["NOTIFICATION_DURATION"])
 
 def byebye(code=0):
     os.system('clear')
@@ -144,7 +188,7 @@ def cleanup_cache():
 
 def init_pretty_print():
     global RED, MAGENTA, CYAN, BOLD, RESET
-    if CONFIG["PRETTY_PRINT"] == "true":
+    if CONFIG_BOOL["PRETTY_PRINT"]:
         try:
             RED = subprocess.check_output(['tput', 'setaf', '1'], text=True).strip()
             MAGENTA = "\x1b[38;2;215;0;95m"
@@ -157,6 +201,79 @@ def init_pretty_print():
             CYAN = "\033[36m"
             BOLD = "\033[1m"
             RESET = "\033[0m"
+    _build_menu_strings()
+
+# Static menu strings, rebuilt once the colors are known; the option lists
+# never change between keypresses so there is no point re-joining them on
+# every loop iteration
+MEDIA_ACTIONS_STR = ""
+_MEDIA_ACTION_LOOKUP = {}  # colored display line -> plain action name
+CHANNEL_ACTIONS_STR = ""
+_CHANNEL_ACTION_LOOKUP = {}
+MAIN_MENU_OPTIONS_STR = ""
+_MAIN_MENU_LOOKUP = {}
+
+def _build_menu_strings():
+    global MEDIA_ACTIONS_STR, CHANNEL_ACTIONS_STR, MAIN_MENU_OPTIONS_STR
+    media_pairs = [
+        ("Watch", f"{CYAN}{RESET}  Watch"),
+        ("Play All", f"{CYAN}{RESET}  Play All"),
+        ("Listen", f"{CYAN}󰎆{RESET}  Listen"),
+        ("Listen To All", f"{CYAN}{RESET}  Listen To All"),
+        ("Mix", f"{CYAN}{RESET}  Mix"),
+        ("Save", f"{CYAN}{RESET}  Save"),
+        ("UnSave", f"{CYAN}󰧎{RESET}  UnSave"),
+        ("Save Playlist", f"{CYAN}󰐒{RESET}  Save Playlist"),
+        ("Subscribe To Channel", f"{CYAN}󰵀{RESET}  Subscribe To Channel"),
+        ("Download", f"{CYAN}󱑤{RESET}  Download"),
+        ("Download All", f"{CYAN}󰦗{RESET}  Download All"),
+        ("Download (Audio Only)", f"{CYAN}󱑤{RESET}  Download (Audio Only)"),
+        ("Download All (Audio Only)", f"{CYAN}󰦗{RESET}  Download All (Audio Only)"),
+        ("Open in Browser", f"{CYAN}{RESET}  Open in Browser"),
+        ("Toggle Enumerate Downloads", f"{CYAN}{RESET}  Toggle Enumerate Downloads"),
+        ("Shell", f"{CYAN}{RESET}  Shell"),
+        ("Back", f"{CYAN}󰌍{RESET}  Back"),
+        ("Exit", f"{RED}󰈆{RESET}  Exit")
+    ]
+    MEDIA_ACTIONS_STR = "\n".join(d for _, d in media_pairs)
+    _MEDIA_ACTION_LOOKUP.clear()
+    _MEDIA_ACTION_LOOKUP.update({d: n for n, d in media_pairs})
+    channel_pairs = [
+        ("Videos", f"{CYAN}{RESET}  Videos"),
+        ("Featured", f"{CYAN}󰩉{RESET}  Featured"),
+        ("Search", f"{CYAN}{RESET}  Search"),
+        ("Playlists", f"{CYAN}󰐑{RESET}  Playlists"),
+        ("Shorts", f"{CYAN}{RESET}  Shorts"),
+        ("Streams", f"{CYAN}󰠿{RESET}  Streams"),
+        ("Podcasts", f"{CYAN}{RESET}  Podcasts"),
+        ("Subscribe", f"{CYAN}󰵀{RESET}  Subscribe"),
+        ("Back", f"{CYAN}󰌍{RESET}  Back"),
+        ("Exit", f"{RED}󰈆{RESET}  Exit")
+    ]
+    CHANNEL_ACTIONS_STR = "\n".join(d for _, d in channel_pairs)
+    _CHANNEL_ACTION_LOOKUP.clear()
+    _CHANNEL_ACTION_LOOKUP.update({d: n for n, d in channel_pairs})
+    menu_pairs = [
+        ("Your Feed", f"{CYAN}{RESET}  Your Feed"),
+        ("Trending", f"{CYAN}{RESET}  Trending"),
+        ("Playlists", f"{CYAN}󰐑{RESET}  Playlists"),
+        ("Search", f"{CYAN}{RESET}  Search"),
+        ("Watch Later", f"{CYAN}{RESET}  Watch Later"),
+        ("Subscription Feed", f"{CYAN}󰵀{RESET}  Subscription Feed"),
+        ("Channels", f"{CYAN}󰑈{RESET}  Channels"),
+        ("Custom Playlists", f"{CYAN}{RESET}  Custom Playlists"),
+        ("Liked Videos", f"{CYAN}{RESET}  Liked Videos"),
+        ("Saved Videos", f"{CYAN}{RESET}  Saved Videos"),
+        ("Watch History", f"{CYAN}{RESET}  Watch History"),
+        ("Recent", f"{CYAN}{RESET}  Recent"),
+        ("Clips", f"{CYAN}{RESET}  Clips"),
+        ("Edit Config", f"{CYAN}{RESET}  Edit Config"),
+        ("Miscellaneous", f"{CYAN}{RESET}  Miscellaneous"),
+        ("Exit", f"{RED}󰈆{RESET}  Exit")
+    ]
+    MAIN_MENU_OPTIONS_STR = "\n".join(d for _, d in menu_pairs)
+    _MAIN_MENU_LOOKUP.clear()
+    _MAIN_MENU_LOOKUP.update({d: n for n, d in menu_pairs})
 
 def create_bash_helpers():
     """
@@ -271,7 +388,7 @@ elif [ "$MODE" = "channel" ]; then
 elif [ "$MODE" = "playlist" ]; then
   if ! [ -z "$SELECTION" ] && ! [ "$SELECTION" = "Back" ] && ! [ "$SELECTION" = "Exit" ] && ! [ "$SELECTION" = "Main Menu" ]; then
     title="$(echo "$SELECTION" | sed 's/"/\\\\\\"/g')"
-    video=$(echo "$playlist_results" | jq -r ".entries | map(select(.title == \\"$title\\" )) | .[0]" 2>/dev/null)
+    video=$(jq -r ".entries | map(select(.title == \\"$title\\" )) | .[0]" "$playlist_results_path" 2>/dev/null)
     title="$(echo "$title" | sed -E 's/^[0-9]+ //g')"
     id=$(echo "$video" | jq '.thumbnails[-1].url' -r | generate_sha256)
 
@@ -321,7 +438,8 @@ def load_config():
     if not os.path.exists(CONFIG["DOWNLOAD_DIRECTORY"]):
         os.makedirs(CONFIG["DOWNLOAD_DIRECTORY"], exist_ok=True)
 
-    PLAYLIST_END = int(CONFIG["NO_OF_SEARCH_RESULTS"])
+    _refresh_typed_config()
+    PLAYLIST_END = CONFIG_INT["NO_OF_SEARCH_RESULTS"]
     init_pretty_print()
     create_bash_helpers()
     cleanup_cache() # Run cleanup on startup
@@ -357,7 +475,9 @@ def prompt(text, value=""):
     if os.path.exists(history_file):
         try:
             with open(history_file, 'r') as f:
-                lines = [l.strip() for l in f if l.strip()]
+                raw = f.read()
+            # one read + one strip pass instead of stripping each line twice
+            lines = [s for s in map(str.strip, raw.splitlines()) if s]
             lines = lines[-10:]
             lines.reverse()
             history_formatted = "\n".join([f"{i+1}. {l}" for i, l in enumerate(lines)])
@@ -367,7 +487,7 @@ def prompt(text, value=""):
 
     if CONFIG["PREFERRED_SELECTOR"] == "rofi":
         cmd = ["rofi", "-dmenu", "-p", f"{text}: "]
-        if CONFIG["SEARCH_HISTORY"] == "true" and history_text:
+        if CONFIG_BOOL["SEARCH_HISTORY"] and history_text:
              cmd.extend(["-mesg", history_text])
 
         proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
@@ -376,7 +496,7 @@ def prompt(text, value=""):
 
     elif shutil.which("gum"):
         header = CLI_HEADER
-        if CONFIG["SEARCH_HISTORY"] == "true" and history_text:
+        if CONFIG_BOOL["SEARCH_HISTORY"] and history_text:
             header += "\n" + history_text
 
         cmd = ["gum", "input", "--header", header, "--prompt", f"{text}: ", "--value", value]
@@ -385,7 +505,7 @@ def prompt(text, value=""):
 
     else:
         sys.stderr.write(f"{CLI_HEADER}\n")
-        if CONFIG["SEARCH_HISTORY"] == "true" and history_text:
+        if CONFIG_BOOL["SEARCH_HISTORY"] and history_text:
             sys.stderr.write(f"{history_text}\n")
         sys.stderr.write(f"{text}: ")
         sys.stderr.flush()
@@ -444,7 +564,23 @@ def launcher(options_str, prompt_text, preview_mode=None):
             return lines[1]
         return lines[0]
 
-def run_yt_dlp(url, extra_args=None):
+# Last few fetched pages, keyed by (url, start, end) so bouncing between
+# Next and Previous does not re-run yt-dlp for a page just viewed. Entries
+# are shallow-copied on the way out because the explorer renames titles.
+_PAGE_CACHE = OrderedDict()
+_PAGE_CACHE_SIZE = 16
+
+def _page_copy(result):
+    copy = dict(result)
+    copy["entries"] = [dict(e) if e else e for e in result.get("entries", [])]
+    return copy
+
+def run_yt_dlp(url, extra_args=None, quiet=False):
+    cache_key = (url, PLAYLIST_START, PLAYLIST_END) if not extra_args else None
+    if cache_key in _PAGE_CACHE:
+        _PAGE_CACHE.move_to_end(cache_key)
+        return _page_copy(_PAGE_CACHE[cache_key])
+
     cmd = ["yt-dlp", url, "-J", "--flat-playlist", "--extractor-args", "youtubetab:approximate_date",
            "--playlist-start", str(PLAYLIST_START), "--playlist-end", str(PLAYLIST_END)]
 
@@ -454,7 +590,10 @@ def run_yt_dlp(url, extra_args=None):
     if extra_args:
         cmd.extend(extra_args)
 
-    if shutil.which("gum"):
+    if quiet:
+        # background prefetches must not fight the menu for the terminal
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    elif shutil.which("gum"):
         spin_cmd = ["gum", "spin", "--show-output", "--"] + cmd
         proc = subprocess.run(spin_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
     else:
@@ -462,14 +601,20 @@ def run_yt_dlp(url, extra_args=None):
         proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
 
     if proc.returncode != 0:
-        send_notification("Failed to fetch data : (")
+        if not quiet: send_notification("Failed to fetch data : (")
         return None
 
     try:
-        return json.loads(proc.stdout)
+        result = json.loads(proc.stdout)
     except json.JSONDecodeError:
         return None
 
+    if cache_key and isinstance(result, dict) and "entries" in result:
+        _PAGE_CACHE[cache_key] = _page_copy(result)
+        if len(_PAGE_CACHE) > _PAGE_CACHE_SIZE:
+            _PAGE_CACHE.popitem(last=False)
+    return result
+
 # ==========================================
 # PREVIEW GENERATION
 # ==========================================
@@ -485,7 +630,7 @@ def generate_text_preview(data):
         # Robustness: Use shlex.quote to safely escape strings for Bash
         raw_title = video.get("title", "")
         # Remove leading numbers for hashing consistency
-        clean_title = re.sub(r'^[0-9]+ ', '', raw_title)
+        clean_title = _RE_LEADING_NUM.sub('', raw_title)
         
         # Hash the clean title to match what the Bash script will calculate
         filename_hash = generate_sha256(clean_title)
@@ -561,6 +706,26 @@ echo
         with open(os.path.join(CLI_PREVIEW_SCRIPTS_DIR, f"{filename_hash}.txt"), "w") as f:
             f.write(content)
 
+# Probed once: curl gained -Z/--parallel in 7.66, and an HTTP/2 build can
+# multiplex every thumbnail over one connection to i.ytimg.com instead of
+# fetching them back to back
+_CURL_FLAGS = None
+
+def _curl_parallel_flags():
+    global _CURL_FLAGS
+    if _CURL_FLAGS is None:
+        _CURL_FLAGS = []
+        try:
+            out = subprocess.check_output(["curl", "--version"], text=True)
+            major, minor = out.split()[1].split('.')[:2]
+            if (int(major), int(minor)) >= (7, 66):
+                _CURL_FLAGS += ["-Z", "--parallel-max", "16"]
+            if "HTTP2" in out:
+                _CURL_FLAGS.append("--http2")
+        except (OSError, subprocess.CalledProcessError, ValueError, IndexError):
+            pass
+    return _CURL_FLAGS
+
 def download_preview_images(data, prefix=""):
     if not data or "entries" not in data: return
     generate_text_preview(data)
@@ -585,41 +750,105 @@ def download_preview_images(data, prefix=""):
                 f.write(f'url = "{prefix}{url}"\n')
                 f.write(f'output = "{CLI_PREVIEW_IMAGES_CACHE_DIR}/{filename}.jpg"\n')
 
-        subprocess.Popen(["curl", "-s", "-K", previews_file], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+        subprocess.Popen(["curl", "-s"] + _curl_parallel_flags() + ["-K", previews_file],
+                         stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
 
 # ==========================================
 # CORE LOGIC
 # ==========================================
 
+# State files (recent.json, saved_videos.json, subscriptions.json) are only
+# ever written by this process, so parse each one once and keep the entries
+# as an insertion-ordered {id: entry} dict: dedup and append are O(1)
+# instead of rewriting the whole list on every Save/Watch.
+_JSON_CACHE = {}
+
+def _load_json(filepath):
+    state = _JSON_CACHE.get(filepath)
+    if state is None:
+        entries = []
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, 'r') as f: entries = json.load(f).get("entries", [])
+            except (json.JSONDecodeError, OSError):
+                # Robustness: Handle corrupted JSON files gracefully
+                entries = []
+        state = {e.get("id"): e for e in entries}
+        _JSON_CACHE[filepath] = state
+    return state
+
 def update_json_list(filename, video, add=True, limit=None):
     filepath = os.path.join(CLI_CONFIG_DIR, filename)
-    data = {"entries": []}
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, 'r') as f: data = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            # Robustness: Handle corrupted JSON files gracefully
-            pass
+    state = _load_json(filepath)
 
     vid_id = video.get("id")
-    data["entries"] = [e for e in data["entries"] if e.get("id") != vid_id]
+    existed = state.pop(vid_id, None) is not None
 
     if add:
         video_copy = video.copy()
-        video_copy["title"] = re.sub(r'^[0-9]+ ', '', video_copy.get("title", ""))
-        data["entries"].append(video_copy)
+        video_copy["title"] = _strip_num_prefix(video_copy.get("title", ""))
+        state[vid_id] = video_copy
+    elif not existed:
+        # UnSave of an id that was never saved: nothing changed, skip the write
+        return
 
-    if limit and len(data["entries"]) > limit:
-        data["entries"] = data["entries"][-limit:]
+    # dicts keep insertion order, so dropping the first keys == keeping
+    # the most recent `limit` entries
+    while limit and len(state) > limit:
+        del state[next(iter(state))]
 
     try:
-        with open(filepath, 'w') as f: json.dump(data, f)
+        with open(filepath, 'w') as f:
+            f.write(json.dumps({"entries": list(state.values())}, separators=(',', ':'), ensure_ascii=False))
     except OSError:
         send_notification(f"Error writing to {filename}")
 
 def update_recent(video):
-    if CONFIG["UPDATE_RECENT"] != "true": return
-    update_json_list("recent.json", video, add=True, limit=int(CONFIG["NO_OF_RECENT"]))
+    if not CONFIG_BOOL["UPDATE_RECENT"]: return
+    update_json_list("recent.json", video, add=True, limit=CONFIG_INT["NO_OF_RECENT"])
+
+# yt-dlp --get-url resolves take a second or more, so they are kicked off
+# while the user is still deciding in the action menu and only waited on
+# when Watch/Listen actually needs the stream URL
+_URL_PREFETCH = {}   # (url, format) -> in-flight Popen
+_URL_RESOLVED = {}   # (url, format) -> (stream URL, resolve time)
+_URL_RESOLVED_TTL = 3600  # googlevideo links expire; re-resolve stale ones
+
+def _cached_stream_url(key):
+    hit = _URL_RESOLVED.get(key)
+    if hit and time.time() - hit[1] < _URL_RESOLVED_TTL:
+        return hit[0]
+    return None
+
+def _prefetch_stream_url(vid_url, fmt):
+    key = (vid_url, fmt)
+    if _cached_stream_url(key) is None and key not in _URL_PREFETCH:
+        _URL_PREFETCH[key] = subprocess.Popen(
+            ["yt-dlp", vid_url, "-q", "--no-warnings", "--get-url", "--format", fmt],
+            stdout=subprocess.PIPE, text=True)
+
+def _resolve_stream_url(vid_url, fmt):
+    key = (vid_url, fmt)
+    cached = _cached_stream_url(key)
+    if cached: return cached
+    proc = _URL_PREFETCH.pop(key, None)
+    if proc is None:
+        proc = subprocess.Popen(
+            ["yt-dlp", vid_url, "-q", "--no-warnings", "--get-url", "--format", fmt],
+            stdout=subprocess.PIPE, text=True)
+    out = proc.communicate()[0]
+    resolved = out.strip().split('\n')[-1] if out.strip() else ""
+    # Failures stay uncached so the next attempt re-runs yt-dlp instead of
+    # replaying an empty URL for the rest of the session
+    if resolved:
+        _URL_RESOLVED[key] = (resolved, time.time())
+    else:
+        _URL_RESOLVED.pop(key, None)
+    return resolved
+
+def _discard_prefetches(vid_url):
+    for key in [k for k in _URL_PREFETCH if k[0] == vid_url]:
+        _URL_PREFETCH.pop(key).terminate()
 
 def playlist_explorer(search_results, url, urlForAll=None):
     global PLAYLIST_START, PLAYLIST_END
@@ -634,43 +863,45 @@ def playlist_explorer(search_results, url, urlForAll=None):
         
         # Only modify titles if we haven't already processed this batch (download_images is False)
         if not download_images:
-            for i, entry in enumerate(entries):
+            width = 2 if len(entries) < 10 else len(str(len(entries)))
+            for i, entry in enumerate(entries, 1):
                 if not entry: continue
-                num = str(i + 1)
-                if len(entries) < 10 and len(num) < 2: num = "0" + num
-                entry["title"] = f"{num} {entry.get('title', '')}"
+                entry["title"] = f"{i:0{width}d} {entry.get('title', '')}"
                 titles.append(entry["title"])
         else:
             # If already processed, just rebuild the titles list from the existing entries
             for entry in entries:
                 if entry: titles.append(entry.get("title", ""))
 
-        if CONFIG["ENABLE_PREVIEW"] == "true" and CONFIG["PREFERRED_SELECTOR"] == "fzf" and not download_images:
+        if CONFIG_BOOL["ENABLE_PREVIEW"] and CONFIG_BOOL["FZF"] and not download_images:
             download_preview_images(search_results)
             download_images = True
 
-        if CONFIG["ENABLE_PREVIEW"] == "true":
+        if CONFIG_BOOL["ENABLE_PREVIEW"]:
             options_str = "\n".join(titles) + f"\nNext\nPrevious\n{CYAN}󰌍{RESET}  Back\n{CYAN}󰍜{RESET}  Main Menu\n{RED}󰈆{RESET}  Exit"
             selection = launcher(options_str, "select video", "video")
         else:
             options_str = "\n".join(titles + ["Next", "Previous", "Back", "Main Menu", "Exit"])
             selection = launcher(options_str, "select video")
 
-        selection = re.sub(r'^[^0-9]*  ', '', selection)
+        # Menu rows look like "<icon>  Label"; enumerated titles already start
+        # with their number, so only strip rows carrying an icon prefix
+        if not selection[:1].isdigit():
+            selection = selection.rpartition('  ')[2] or selection
         os.system('clear')
 
         if selection == "Next":
-            PLAYLIST_START += int(CONFIG["NO_OF_SEARCH_RESULTS"])
-            PLAYLIST_END += int(CONFIG["NO_OF_SEARCH_RESULTS"])
+            PLAYLIST_START += CONFIG_INT["NO_OF_SEARCH_RESULTS"]
+            PLAYLIST_END += CONFIG_INT["NO_OF_SEARCH_RESULTS"]
             search_results = run_yt_dlp(url)
             download_images = False
             continue
         elif selection == "Previous":
-            PLAYLIST_START -= int(CONFIG["NO_OF_SEARCH_RESULTS"])
+            PLAYLIST_START -= CONFIG_INT["NO_OF_SEARCH_RESULTS"]
             if PLAYLIST_START <= 0: PLAYLIST_START = 1
-            PLAYLIST_END -= int(CONFIG["NO_OF_SEARCH_RESULTS"])
+            PLAYLIST_END -= CONFIG_INT["NO_OF_SEARCH_RESULTS"]
             # Robustness: Ensure END doesn't drop below the page size
-            min_end = int(CONFIG["NO_OF_SEARCH_RESULTS"])
+            min_end = CONFIG_INT["NO_OF_SEARCH_RESULTS"]
             if PLAYLIST_END < min_end: PLAYLIST_END = min_end
             
             search_results = run_yt_dlp(url)
@@ -684,26 +915,30 @@ def playlist_explorer(search_results, url, urlForAll=None):
         try:
             sel_id = int(selection.split(' ')[0])
             video = entries[sel_id - 1]
-            clean_title = re.sub(r'^[0-9]+ ', '', video['title'])
+            clean_title = _strip_num_prefix(video['title'])
         except (ValueError, IndexError): continue
 
+        # Start resolving the stream URLs now so a later Watch/Listen does
+        # not stall on yt-dlp; mpv resolves for itself, so only prefetch
+        # when the player needs a direct URL
+        if CONFIG["PLAYER"] != "mpv" or PLATFORM == "android":
+            sel_url = video.get("url")
+            if sel_url and "list=RD" not in sel_url:
+                _prefetch_stream_url(sel_url, f"best[height<={CONFIG['VIDEO_QUALITY']}]/best")
+                _prefetch_stream_url(sel_url, "bestaudio/best")
+
         while True:
-            media_actions = [
-                f"{CYAN}{RESET}  Watch", f"{CYAN}{RESET}  Play All", f"{CYAN}󰎆{RESET}  Listen",
-                f"{CYAN}{RESET}  Listen To All", f"{CYAN}{RESET}  Mix", f"{CYAN}{RESET}  Save",
-                f"{CYAN}󰧎{RESET}  UnSave", f"{CYAN}󰐒{RESET}  Save Playlist", f"{CYAN}󰵀{RESET}  Subscribe To Channel",
-                f"{CYAN}󱑤{RESET}  Download", f"{CYAN}󰦗{RESET}  Download All", f"{CYAN}󱑤{RESET}  Download (Audio Only)",
-                f"{CYAN}󰦗{RESET}  Download All (Audio Only)", f"{CYAN}{RESET}  Open in Browser",
-                f"{CYAN}{RESET}  Toggle Enumerate Downloads", f"{CYAN}{RESET}  Shell",
-                f"{CYAN}󰌍{RESET}  Back", f"{RED}󰈆{RESET}  Exit"
-            ]
-
-            action_sel = launcher("\n".join(media_actions), "Select Media Action")
-            action_sel = re.sub(r'.  ', '', action_sel)
+            action_sel = launcher(MEDIA_ACTIONS_STR, "Select Media Action")
+            # the launcher echoes the display line back; resolve it with one
+            # dict hit, falling back to the separator split for selectors
+            # that strip the colors
+            action_sel = _MEDIA_ACTION_LOOKUP.get(action_sel) or action_sel.rpartition('  ')[2] or action_sel
             os.system('clear')
 
             if action_sel == "Exit": byebye()
-            if action_sel in ["Back", ""]: break
+            if action_sel in ["Back", ""]:
+                _discard_prefetches(video.get("url"))
+                break
 
             vid_url = video.get("url")
 
@@ -713,32 +948,30 @@ def playlist_explorer(search_results, url, urlForAll=None):
                     vid_id = video.get("id", "").replace("RD", "")
                     mix_url = f"https://www.youtube.com/watch?v={vid_id}&list=RD{vid_id}"
                     cached_pl = os.path.join(CLI_AUTO_GEN_PLAYLISTS, f"{generate_sha256(mix_url)}.m3u8")
-                    if not os.path.exists(cached_pl) or os.path.getsize(cached_pl) == 0:
+                    if _missing_or_empty(cached_pl):
                         mix_data = run_yt_dlp(mix_url)
                         if mix_data:
                             with open(cached_pl, 'w') as f:
                                 f.write('#EXTM3U\n')
                                 for entry in mix_data.get('entries', []):
                                     f.write(f"#EXTINF:-1,{entry.get('title')}\n{entry.get('url')}\n\n")
-                    subprocess.Popen(["mpv", cached_pl], start_new_session=(CONFIG["DISOWN_STREAMING_PROCESS"]=="true"))
+                    subprocess.Popen(["mpv", cached_pl], start_new_session=CONFIG_BOOL["DISOWN_STREAMING_PROCESS"])
                 else:
                     if CONFIG["PLAYER"] != "mpv" or PLATFORM == "android":
-                        proc = subprocess.run(["yt-dlp", vid_url, "-q", "--no-warnings", "--get-url", "--format", f"best[height<={CONFIG['VIDEO_QUALITY']}]/best"], stdout=subprocess.PIPE, text=True)
-                        vid_url = proc.stdout.strip().split('\n')[-1] if proc.stdout.strip() else ""
+                        vid_url = _resolve_stream_url(vid_url, f"best[height<={CONFIG['VIDEO_QUALITY']}]/best")
 
                     if CONFIG["PLAYER"] == "mpv":
-                        subprocess.Popen(["mpv", vid_url], start_new_session=(CONFIG["DISOWN_STREAMING_PROCESS"]=="true"))
+                        subprocess.Popen(["mpv", vid_url], start_new_session=CONFIG_BOOL["DISOWN_STREAMING_PROCESS"])
                     elif CONFIG["PLAYER"] == "vlc":
-                        subprocess.Popen(["vlc", vid_url, "--video-title", clean_title], start_new_session=(CONFIG["DISOWN_STREAMING_PROCESS"]=="true"))
+                        subprocess.Popen(["vlc", vid_url, "--video-title", clean_title], start_new_session=CONFIG_BOOL["DISOWN_STREAMING_PROCESS"])
                 update_recent(video)
 
             elif action_sel == "Listen":
                 print(f"{MAGENTA}Now Listening to:{RESET} {clean_title}")
                 if CONFIG["PLAYER"] != "mpv" or PLATFORM == "android":
-                     proc = subprocess.run(["yt-dlp", vid_url, "-q", "--no-warnings", "--get-url", "--format", "bestaudio/best"], stdout=subprocess.PIPE, text=True)
-                     vid_url = proc.stdout.strip().split('\n')[-1]
+                     vid_url = _resolve_stream_url(vid_url, "bestaudio/best")
                 if CONFIG["PLAYER"] == "mpv":
-                    subprocess.Popen(["mpv", vid_url, "--no-video", "--force-window=no"], start_new_session=(CONFIG["DISOWN_STREAMING_PROCESS"]=="true"))
+                    subprocess.Popen(["mpv", vid_url, "--no-video", "--force-window=no"], start_new_session=CONFIG_BOOL["DISOWN_STREAMING_PROCESS"])
                 update_recent(video)
 
             elif action_sel == "Download":
@@ -758,8 +991,8 @@ def playlist_explorer(search_results, url, urlForAll=None):
             elif action_sel == "Save": update_json_list("saved_videos.json", video, add=True)
             elif action_sel == "UnSave": update_json_list("saved_videos.json", video, add=False)
             elif action_sel == "Open in Browser":
-                if shutil.which("open"): subprocess.run(["open", vid_url])
-                elif shutil.which("xdg-open"): subprocess.run(["xdg-open", vid_url])
+                opener = _get_opener()
+                if opener: subprocess.run([opener, vid_url])
             elif action_sel == "Toggle Enumerate Downloads":
                 enumerate_playlist = "%(playlist_index)s - " if enumerate_playlist == "" else ""
             elif action_sel == "Mix":
@@ -790,7 +1023,7 @@ def playlist_explorer(search_results, url, urlForAll=None):
                     subprocess.run([user_shell], env=shell_env)
 
     PLAYLIST_START = 1
-    PLAYLIST_END = int(CONFIG["NO_OF_SEARCH_RESULTS"])
+    PLAYLIST_END = CONFIG_INT["NO_OF_SEARCH_RESULTS"]
 
 def playlists_explorer(url):
     playlist_results = run_yt_dlp(url)
@@ -798,54 +1031,76 @@ def playlists_explorer(url):
 
     entries = playlist_results.get("entries", [])
     titles = []
-    for i, entry in enumerate(entries):
-        num = str(i + 1)
-        if len(entries) < 10 and len(num) < 2: num = "0" + num
-        entry["title"] = f"{num} {entry.get('title', '')}"
+    width = 2 if len(entries) < 10 else len(str(len(entries)))
+    for i, entry in enumerate(entries, 1):
+        entry["title"] = f"{i:0{width}d} {entry.get('title', '')}"
         titles.append(entry["title"])
-
-    os.environ["playlist_results"] = json.dumps(playlist_results)
-    if CONFIG["ENABLE_PREVIEW"] == "true" and CONFIG["PREFERRED_SELECTOR"] == "fzf":
+    # titles are unique once enumerated, so selections resolve in O(1)
+    pl_index = {e["title"]: e for e in entries}
+
+    # The preview dispatcher reads this with jq; pass a file path instead of
+    # stuffing the serialized dump into the environment, which every child
+    # process would otherwise inherit and copy
+    results_path = os.path.join(CLI_CACHE_DIR, "playlist_results.json")
+    with open(results_path, 'w') as f:
+        f.write(json.dumps(playlist_results, separators=(',', ':'), ensure_ascii=False))
+    os.environ["playlist_results_path"] = results_path
+    if CONFIG_BOOL["ENABLE_PREVIEW"] and CONFIG_BOOL["FZF"]:
         download_preview_images(playlist_results)
 
     while True:
-        if CONFIG["ENABLE_PREVIEW"] == "true":
+        if CONFIG_BOOL["ENABLE_PREVIEW"]:
             options = "\n".join(titles) + f"\n{CYAN}󰌍{RESET}  Back\n{RED}󰈆{RESET}  Exit"
             sel = launcher(options, "select video", "playlist")
         else:
             options = "\n".join(titles) + "\nBack\nExit"
             sel = launcher(options, "select video")
 
-        sel = re.sub(r'^[^0-9]*  ', '', sel).strip()
+        if not sel[:1].isdigit():
+            sel = sel.rpartition('  ')[2] or sel
+        sel = sel.strip()
         os.system('clear')
 
         if "Back" in sel or not sel: break
         if "Exit" in sel: byebye()
 
-        playlist = next((e for e in entries if e["title"] == sel), None)
+        playlist = pl_index.get(sel)
         if playlist:
             pl_url = playlist.get("url")
             search_results = run_yt_dlp(pl_url)
             playlist_explorer(search_results, pl_url)
 
 def channels_explorer(channel):
+    uploader_url = channel.get("uploader_url")
+
+    # Speculatively fetch the common tabs while the user is reading the
+    # menu; the results land in the page cache, so a tab click only waits
+    # out whatever is left of the matching future
+    executor = ThreadPoolExecutor(max_workers=3)
+    prefetch = {f"{uploader_url}/{tab}": executor.submit(run_yt_dlp, f"{uploader_url}/{tab}", None, True)
+                for tab in ("videos", "streams", "playlists")}
+    executor.shutdown(wait=False)
+
+    def _await_prefetch(tab_url):
+        fut = prefetch.pop(tab_url, None)
+        if fut is not None: fut.result()
+
     while True:
-        actions = [
-            f"{CYAN}{RESET}  Videos", f"{CYAN}󰩉{RESET}  Featured", f"{CYAN}{RESET}  Search",
-            f"{CYAN}󰐑{RESET}  Playlists", f"{CYAN}{RESET}  Shorts", f"{CYAN}󰠿{RESET}  Streams",
-            f"{CYAN}{RESET}  Podcasts", f"{CYAN}󰵀{RESET}  Subscribe", f"{CYAN}󰌍{RESET}  Back",
-            f"{RED}󰈆{RESET}  Exit"
-        ]
-        sel = launcher("\n".join(actions), "Select Action")
-        sel = re.sub(r'.  ', '', sel)
+        sel = launcher(CHANNEL_ACTIONS_STR, "Select Action")
+        sel = _CHANNEL_ACTION_LOOKUP.get(sel) or sel.rpartition('  ')[2] or sel
 
         if sel == "Exit": byebye()
         if sel in ["Back", ""]: break
 
-        uploader_url = channel.get("uploader_url")
-        if sel == "Videos": playlist_explorer(run_yt_dlp(f"{uploader_url}/videos"), f"{uploader_url}/videos")
-        elif sel == "Streams": playlist_explorer(run_yt_dlp(f"{uploader_url}/streams"), f"{uploader_url}/streams")
-        elif sel == "Playlists": playlists_explorer(f"{uploader_url}/playlists")
+        if sel == "Videos":
+            _await_prefetch(f"{uploader_url}/videos")
+            playlist_explorer(run_yt_dlp(f"{uploader_url}/videos"), f"{uploader_url}/videos")
+        elif sel == "Streams":
+            _await_prefetch(f"{uploader_url}/streams")
+            playlist_explorer(run_yt_dlp(f"{uploader_url}/streams"), f"{uploader_url}/streams")
+        elif sel == "Playlists":
+            _await_prefetch(f"{uploader_url}/playlists")
+            playlists_explorer(f"{uploader_url}/playlists")
         elif sel == "Search":
             os.system('clear')
             term = prompt("Enter term to search for")
@@ -854,110 +1109,119 @@ def channels_explorer(channel):
             playlist_explorer(run_yt_dlp(url), url)
         elif sel == "Subscribe":
             sub_file = os.path.join(CLI_CONFIG_DIR, "subscriptions.json")
-            if not os.path.exists(sub_file) or os.path.getsize(sub_file) == 0:
-                if confirm("Import YouTube subscriptions?"):
-                    data = run_yt_dlp("https://www.youtube.com/feed/channels")
-                    with open(sub_file, 'w') as f: json.dump(data, f)
-                else: data = {"entries": []}
-            else:
-                try:
-                    with open(sub_file, 'r') as f: data = json.load(f)
-                except json.JSONDecodeError:
-                    data = {"entries": []}
+            state = _JSON_CACHE.get(sub_file)
+            if state is None:
+                if _missing_or_empty(sub_file):
+                    if confirm("Import YouTube subscriptions?"):
+                        data = run_yt_dlp("https://www.youtube.com/feed/channels")
+                        with open(sub_file, 'w') as f: f.write(json.dumps(data, separators=(',', ':'), ensure_ascii=False))
+                    else: data = {"entries": []}
+                else:
+                    try:
+                        with open(sub_file, 'r') as f: data = json.load(f)
+                    except json.JSONDecodeError:
+                        data = {"entries": []}
+                state = {e.get("id"): e for e in (data or {}).get("entries", [])}
+                if data: _JSON_CACHE[sub_file] = state
 
             cid = channel.get("id")
-            data["entries"] = [e for e in data["entries"] if e.get("id") != cid]
-            data["entries"].append(channel)
-            with open(sub_file, 'w') as f: json.dump(data, f)
+            state.pop(cid, None)
+            state[cid] = channel
+            with open(sub_file, 'w') as f:
+                f.write(json.dumps({"entries": list(state.values())}, separators=(',', ':'), ensure_ascii=False))
             send_notification("successfully subscribed")
         os.system('clear')
 
 def main_menu(initial_action=None, search_term=None):
-    os.system('clear')
-    action = initial_action
-    if not action:
-        options = [
-            f"{CYAN}{RESET}  Your Feed", f"{CYAN}{RESET}  Trending", f"{CYAN}󰐑{RESET}  Playlists",
-            f"{CYAN}{RESET}  Search", f"{CYAN}{RESET}  Watch Later", f"{CYAN}󰵀{RESET}  Subscription Feed",
-            f"{CYAN}󰑈{RESET}  Channels", f"{CYAN}{RESET}  Custom Playlists", f"{CYAN}{RESET}  Liked Videos",
-            f"{CYAN}{RESET}  Saved Videos", f"{CYAN}{RESET}  Watch History", f"{CYAN}{RESET}  Recent",
-            f"{CYAN}{RESET}  Clips", f"{CYAN}{RESET}  Edit Config", f"{CYAN}{RESET}  Miscellaneous",
-            f"{RED}󰈆{RESET}  Exit"
-        ]
-        sel = launcher("\n".join(options), "Select Action")
-        action = re.sub(r'.*  ', '', sel)
-
-    if action == "Exit": byebye()
-
-    if action == "Your Feed": playlist_explorer(run_yt_dlp("https://www.youtube.com"), "https://www.youtube.com")
-    elif action == "Trending": playlist_explorer(run_yt_dlp("https://www.youtube.com/feed/trending"), "https://www.youtube.com/feed/trending")
-    elif action == "Search":
+    # A plain loop rather than the old tail-recursive call: returning to the
+    # main screen no longer stacks a frame per round trip
+    while True:
         os.system('clear')
-        if not search_term:
-            search_term = prompt("Enter term to search for")
-            if re.match(r'^![0-9]{1,2}$', search_term):
-                idx = int(search_term[1:])
+        # initial_action / search_term only apply to the first pass
+        action, initial_action = initial_action, None
+        term, search_term = search_term, None
+        if not action:
+            sel = launcher(MAIN_MENU_OPTIONS_STR, "Select Action")
+            action = _MAIN_MENU_LOOKUP.get(sel) or sel.rpartition('  ')[2] or sel
+
+        if action == "Exit": byebye()
+
+        if action == "Your Feed": playlist_explorer(run_yt_dlp("https://www.youtube.com"), "https://www.youtube.com")
+        elif action == "Trending": playlist_explorer(run_yt_dlp("https://www.youtube.com/feed/trending"), "https://www.youtube.com/feed/trending")
+        elif action == "Search":
+            os.system('clear')
+            if not term:
+                term = prompt("Enter term to search for")
+                if _RE_HIST_BANG.match(term):
+                    idx = int(term[1:])
+                    hist_file = os.path.join(CLI_CACHE_DIR, "search_history.txt")
+                    if os.path.exists(hist_file):
+                        try:
+                            with open(hist_file) as f: raw = f.read()
+                            lines = [s for s in map(str.strip, raw.splitlines()) if s]
+                            if lines and idx <= 10: term = lines[-idx]
+                        except Exception: pass
+
+            if not term: continue
+
+            sp = "EgIQAQ%253D%253D"
+            match = _RE_FILTER_CMD.match(term)
+            if match:
+                filter_cmd, term = match.groups()
+                if filter_cmd == ":hour": sp="EgIIAQ%253D%253D"
+                elif filter_cmd == ":today": sp="EgIIAg%253D%253D"
+                elif filter_cmd == ":week": sp="EgIIAw%253D%253D"
+                elif filter_cmd == ":month": sp="EgIIBA%253D%253D"
+                elif filter_cmd == ":year": sp="EgIIBQ%253D%253D"
+
+            if CONFIG_BOOL["SEARCH_HISTORY"]:
                 hist_file = os.path.join(CLI_CACHE_DIR, "search_history.txt")
+                lines = []
                 if os.path.exists(hist_file):
                     try:
-                        with open(hist_file) as f: lines = [l.strip() for l in f if l.strip()]
-                        if lines and idx <= 10: search_term = lines[-idx]
+                        with open(hist_file) as f: raw = f.read()
+                        lines = [s for s in map(str.strip, raw.splitlines()) if s and s != term]
                     except Exception: pass
+                lines.append(term)
+                with open(hist_file, 'w') as f: f.write("\n".join(lines) + "\n")
 
-        if not search_term: return main_menu()
-
-        sp = "EgIQAQ%253D%253D"
-        match = re.match(r'^(:[a-z]+)\s+(.+)', search_term)
-        if match:
-            filter_cmd, search_term = match.groups()
-            if filter_cmd == ":hour": sp="EgIIAQ%253D%253D"
-            elif filter_cmd == ":today": sp="EgIIAg%253D%253D"
-            elif filter_cmd == ":week": sp="EgIIAw%253D%253D"
-            elif filter_cmd == ":month": sp="EgIIBA%253D%253D"
-            elif filter_cmd == ":year": sp="EgIIBQ%253D%253D"
-
-        if CONFIG["SEARCH_HISTORY"] == "true":
-            hist_file = os.path.join(CLI_CACHE_DIR, "search_history.txt")
-            lines = []
-            if os.path.exists(hist_file):
-                try:
-                    with open(hist_file) as f: lines = [l.strip() for l in f if l.strip() and l.strip() != search_term]
-                except Exception: pass
-            lines.append(search_term)
-            with open(hist_file, 'w') as f: f.write("\n".join(lines) + "\n")
-
-        term_enc = urllib.parse.quote(search_term)
-        url = f"https://www.youtube.com/results?search_query={term_enc}&sp={sp}"
-        playlist_explorer(run_yt_dlp(url), url)
-
-    elif action == "Channels":
-        while True:
-            sub_file = os.path.join(CLI_CONFIG_DIR, "subscriptions.json")
-            if not os.path.exists(sub_file):
-                print("Loading subscriptions...")
-                data = run_yt_dlp("https://www.youtube.com/feed/channels")
-                if data:
-                    with open(sub_file, 'w') as f: json.dump(data, f)
-            else:
-                try:
-                    with open(sub_file) as f: data = json.load(f)
-                except json.JSONDecodeError:
-                    data = {"entries": []}
-
-            if not data: break
-            channels = [e.get("channel") for e in data.get("entries", [])]
-            options = "\n".join(channels) + "\nMain Menu\nExit"
-            sel = launcher(options, "Select Channel", "channel")
-            if sel == "Exit": byebye()
-            if sel == "Main Menu": break
-            channel = next((e for e in data["entries"] if e["channel"] == sel), None)
-            if channel: channels_explorer(channel)
-
-    elif action == "Edit Config":
-        subprocess.run([CONFIG["EDITOR"], os.path.join(CLI_CONFIG_DIR, f"{CLI_NAME}.conf")])
-        load_config()
+            term_enc = urllib.parse.quote(term)
+            url = f"https://www.youtube.com/results?search_query={term_enc}&sp={sp}"
+            playlist_explorer(run_yt_dlp(url), url)
 
-    main_menu()
+        elif action == "Channels":
+            while True:
+                sub_file = os.path.join(CLI_CONFIG_DIR, "subscriptions.json")
+                state = _JSON_CACHE.get(sub_file)
+                if state is None:
+                    data = None
+                    if not os.path.exists(sub_file):
+                        print("Loading subscriptions...")
+                        data = run_yt_dlp("https://www.youtube.com/feed/channels")
+                        if data:
+                            with open(sub_file, 'w') as f: f.write(json.dumps(data, separators=(',', ':'), ensure_ascii=False))
+                    else:
+                        try:
+                            with open(sub_file) as f: data = json.load(f)
+                        except json.JSONDecodeError:
+                            data = {"entries": []}
+                    if data:
+                        state = {e.get("id"): e for e in data.get("entries", [])}
+                        _JSON_CACHE[sub_file] = state
+
+                if state is None: break
+                channel_index = {e.get("channel"): e for e in state.values()}
+                channels = list(channel_index)
+                options = "\n".join(channels) + "\nMain Menu\nExit"
+                sel = launcher(options, "Select Channel", "channel")
+                if sel == "Exit": byebye()
+                if sel == "Main Menu": break
+                channel = channel_index.get(sel)
+                if channel: channels_explorer(channel)
+
+        elif action == "Edit Config":
+            subprocess.run([CONFIG["EDITOR"], os.path.join(CLI_CONFIG_DIR, f"{CLI_NAME}.conf")])
+            load_config()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description=f"Browse youtube from the terminal ({CLI_NAME})")
@@ -992,6 +1256,7 @@ if __name__ == "__main__":
     if args.rofi_theme: CONFIG["ROFI_THEME"] = args.rofi_theme
     if args.disown_streaming_process: CONFIG["DISOWN_STREAMING_PROCESS"] = "true"
     if args.no_disown_streaming_process: CONFIG["DISOWN_STREAMING_PROCESS"] = "false"
+    _refresh_typed_config()  # CLI flags above may have overridden CONFIG
 
     if args.edit_config:
         subprocess.run([CONFIG["EDITOR"], os.path.join(CLI_CONFIG_DIR, f"{CLI_NAME}.conf")])
@@ -1002,18 +1267,17 @@ if __name__ == "__main__":
             print(f"{dep} is not installed and is a core dep please install it to proceed")
             sys.exit(1)
 
-    if CONFIG["WELCOME_SCREEN"] == "true":
+    if CONFIG_BOOL["WELCOME_SCREEN"]:
         ts_file = os.path.join(CLI_CACHE_DIR, ".last_welcome")
-        last = 0
-        if os.path.exists(ts_file):
-            try: last = int(open(ts_file).read().strip())
-            except: pass
+        # the file's own mtime is the timestamp; no need to store one inside
+        try: last = os.stat(ts_file).st_mtime
+        except OSError: last = 0
 
         if time.time() - last > 86400:
             print(f"{CYAN}How are you {os.environ.get('USER', 'User')} 🙂?\nIf you like the project consider supporting at {CLI_SUPPORT_PROJECT_URL}.{RESET}")
             if confirm("Open support page?"):
                 subprocess.run(["xdg-open", CLI_SUPPORT_PROJECT_URL])
-            with open(ts_file, 'w') as f: f.write(str(int(time.time())))
+            open(ts_file, 'w').close()  # touch; the mtime is the record
 
     try:
         if args.search: main_menu(initial_action="Search", search_term=args.search)
@@ -9,11 +9,29 @@ import time
 import shutil
 import subprocess
 import hashlib
-import argparse
-import platform
-import urllib.parse
+import pickle
 import re
 import shlex
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    # Optional C JSON codec; yt-dlp -J dumps run to megabytes with previews on
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Optional incremental JSON parser; lets preview generation start while
+    # yt-dlp is still streaming its dump
+    import ijson
+except ImportError:
+    ijson = None
+
+# argparse, urllib.parse and platform are imported at their use sites;
+# hashlib and re must stay top-level because module constants depend on them
 
 # ==========================================
 # GLOBAL VARIABLES & CONFIGURATION
@@ -48,16 +66,20 @@ CLI_PREVIEW_DISPATCHER = os.path.join(CLI_CONFIG_DIR, "yt-x-preview.sh")
 for d in [CLI_CONFIG_DIR, CLI_PREVIEW_IMAGES_CACHE_DIR, CLI_PREVIEW_SCRIPTS_DIR]:
     os.makedirs(d, exist_ok=True)
 
-# Platform detection
-uname = platform.uname().system.lower()
-if "android" in uname or "android" in platform.release().lower():
-    PLATFORM = "android"
-elif "darwin" in uname:
-    PLATFORM = "mac"
-elif "windows" in uname or "microsoft" in platform.release().lower():
-    PLATFORM = "windows"
-else:
-    PLATFORM = "linux"
+# Platform detection, deferred until first use so startup skips the
+# platform module import
+@lru_cache(maxsize=None)
+def get_platform():
+    import platform
+    uname = platform.uname().system.lower()
+    release = platform.release().lower()
+    if "android" in uname or "android" in release:
+        return "android"
+    if "darwin" in uname:
+        return "mac"
+    if "windows" in uname or "microsoft" in release:
+        return "windows"
+    return "linux"
 
 # Default Config Dictionary
 CONFIG = {
@@ -75,6 +97,14 @@ CONFIG = {
     "DOWNLOAD_DIRECTORY": os.path.join(XDG_VIDEOS_DIR, CLI_NAME),
 }
 
+# Integer views of the numeric config keys, refreshed by load_config();
+# hot paths read these instead of re-parsing the strings each time
+CONFIG_INT = {}
+
+def _refresh_config_ints():
+    for key in ("NO_OF_SEARCH_RESULTS", "NOTIFICATION_DURATION"):
+        CONFIG_INT[key] = int(CONFIG[key])
+
 # Global State
 PLAYLIST_START = 1
 PLAYLIST_END = 30
@@ -89,21 +119,83 @@ CYAN = ""
 BOLD = ""
 RESET = ""
 
+# Compiled once; rofi menus strip ANSI escapes on every launch
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+# Leading "NN " enumeration prefix added by the explorers
+_NUM_PREFIX_RE = re.compile(r'^[0-9]+ ')
+
+def _strip_num_prefix(s):
+    # Equivalent to _NUM_PREFIX_RE.sub('', s) but a pair of C-level string
+    # ops; the preview loop runs this once per entry
+    head, sep, tail = s.partition(' ')
+    return tail if sep and head.isdigit() else s
+
+# Upload-age buckets: bisect the diff into _TS_BOUNDS and read the matching
+# (divisor, unit); index 0 is "just now"
+_TS_BOUNDS = [60, 3600, 86400, 604800, 2635200, 31622400]
+_TS_UNITS = [(1, None), (60, "minutes ago"), (3600, "hours ago"),
+             (86400, "days ago"), (604800, "weeks ago"),
+             (2635200, "months ago"), (31622400, "years ago")]
+
 # ==========================================
 # HELPER FUNCTIONS
 # ==========================================
 
+# hashlib should resolve to OpenSSL's _hashlib (the EVP path, which enables
+# SHA extensions on capable CPUs); the pure-Python fallback modules are ~3x
+# slower per block, so a build that lost OpenSSL deserves a warning
+_OPENSSL_HASHLIB = getattr(hashlib.sha256, "__module__", "") == "_hashlib"
+
+# The digests are only cache-filename keys, so BLAKE2b-128 (faster per byte,
+# half the hex) beats SHA-256 here. The bash dispatcher must produce the same
+# key, so stay on SHA-256 whenever b2sum is missing or the user opts out.
+LEGACY_HASH = os.environ.get("YT_X_LEGACY_HASH") == "1" or not shutil.which("b2sum")
+
+if LEGACY_HASH:
+    def _digest(data): return hashlib.sha256(data).hexdigest()
+else:
+    def _digest(data): return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+@lru_cache(maxsize=4096)
+def _hash_str(text):
+    return _digest(text.encode('utf-8'))
+
 def generate_sha256(text):
+    # Titles and thumbnail URLs are hashed repeatedly per page; cache the
+    # str case so duplicates cost a dict lookup instead of encode+digest.
+    # Kept under its historical name for the callers and cache layout.
     if text is None: text = ""
-    if isinstance(text, str): text = text.encode('utf-8')
-    return hashlib.sha256(text).hexdigest()
+    if isinstance(text, bytes): return _digest(text)
+    return _hash_str(text)
+
+# curl capabilities probed once: -Z/--parallel needs 7.66+, --http2 needs an
+# nghttp2-enabled build. With both, one connection to i.ytimg.com multiplexes
+# every thumbnail instead of a TLS handshake per file.
+_CURL_FLAGS = None
+
+def _curl_parallel_flags():
+    global _CURL_FLAGS
+    if _CURL_FLAGS is None:
+        _CURL_FLAGS = []
+        try:
+            out = subprocess.check_output(["curl", "--version"], text=True)
+            major, minor = out.split()[1].split('.')[:2]
+            if (int(major), int(minor)) >= (7, 66):
+                _CURL_FLAGS += ["-Z", "--parallel-max", "16"]
+            if "HTTP2" in out:
+                _CURL_FLAGS.append("--http2")
+        except (OSError, subprocess.CalledProcessError, ValueError, IndexError):
+            pass
+    return _CURL_FLAGS
 
 def send_notification(message):
     sys.stderr.write(f"{message}\n")
-    time.sleep(int(CONFIG["NOTIFICATION_DURATION"]))
+    time.sleep(CONFIG_INT.get("NOTIFICATION_DURATION", 5))
 
 def byebye(code=0):
-    os.system('clear')
+    # One write beats forking sh -> clear -> terminfo on the way out
+    sys.stdout.write("\x1b[H\x1b[2J")
+    sys.stdout.flush()
     print(f"Have a good day")
     sys.exit(code)
 
@@ -120,21 +212,38 @@ def cleanup_cache():
                         os.remove(filepath)
     except Exception: pass
 
+# Terminals whose color escapes are the plain ANSI ones; no need to ask tput
+_STD_TERMS = ("xterm", "screen", "tmux", "rxvt", "linux", "alacritty",
+              "kitty", "wezterm", "st-", "foot")
+
 def init_pretty_print():
     global RED, MAGENTA, CYAN, BOLD, RESET
     if CONFIG["PRETTY_PRINT"] == "true":
-        try:
-            RED = subprocess.check_output(['tput', 'setaf', '1'], text=True).strip()
-            MAGENTA = "\x1b[38;2;215;0;95m"
-            CYAN = subprocess.check_output(['tput', 'setaf', '6'], text=True).strip()
-            BOLD = subprocess.check_output(['tput', 'bold'], text=True).strip()
-            RESET = subprocess.check_output(['tput', 'sgr0'], text=True).strip()
-        except:
+        MAGENTA = "\x1b[38;2;215;0;95m"
+        term = os.environ.get("TERM", "")
+        if term.startswith(_STD_TERMS):
+            # The common emulators all understand the standard escapes;
+            # spawning tput four times buys nothing here
             RED = "\033[31m"
-            MAGENTA = "\033[35m"
             CYAN = "\033[36m"
             BOLD = "\033[1m"
             RESET = "\033[0m"
+        else:
+            try:
+                # Exotic TERM: read terminfo in-process, no tput forks at all
+                import curses
+                curses.setupterm()
+                setaf = curses.tigetstr('setaf')
+                RED = curses.tparm(setaf, 1).decode('ascii')
+                CYAN = curses.tparm(setaf, 6).decode('ascii')
+                BOLD = (curses.tigetstr('bold') or b'').decode('ascii')
+                RESET = (curses.tigetstr('sgr0') or b'').decode('ascii')
+            except Exception:
+                RED = "\033[31m"
+                MAGENTA = "\033[35m"
+                CYAN = "\033[36m"
+                BOLD = "\033[1m"
+                RESET = "\033[0m"
 
 def create_bash_helpers():
     # 1. Helper Functions Script
@@ -142,12 +251,14 @@ def create_bash_helpers():
 export CLI_PREVIEW_IMAGES_CACHE_DIR="{CLI_PREVIEW_IMAGES_CACHE_DIR}"
 export CLI_PREVIEW_SCRIPTS_DIR="{CLI_PREVIEW_SCRIPTS_DIR}"
 export IMAGE_RENDERER="{CONFIG['IMAGE_RENDERER']}"
-export PLATFORM="{PLATFORM}"
+export PLATFORM="{get_platform()}"
+export LEGACY_HASH="{1 if LEGACY_HASH else 0}"
 
 generate_sha256() {{
   local input
   if [ -n "$1" ]; then input="$1"; else input=$(cat); fi
-  if command -v sha256sum &>/dev/null; then echo -n "$input" | sha256sum | awk '{{print $1}}'
+  if [ "$LEGACY_HASH" = 0 ] && command -v b2sum &>/dev/null; then echo -n "$input" | b2sum -l 128 | awk '{{print $1}}'
+  elif command -v sha256sum &>/dev/null; then echo -n "$input" | sha256sum | awk '{{print $1}}'
   elif command -v shasum &>/dev/null; then echo -n "$input" | shasum -a 256 | awk '{{print $1}}'
   else echo -n "$input" | base64 | tr '/+' '_-' | tr -d '\\n'; fi
 }}
@@ -188,11 +299,17 @@ export -f fzf_preview
     preview_content = f"""#!/usr/bin/env bash
 source "{CLI_HELPER_SCRIPT}"
 MODE="$1"; shift; SELECTION="$*"
-MAGENTA='\\x1b[38;2;215;0;95m'; BOLD=$(tput bold); RESET=$(tput sgr0)
+# Colors come pre-exported from Python; fzf re-runs this script on every
+# cursor move, so the tput forks here were paid per keystroke
+MAGENTA="${{MAGENTA:-$'\\x1b[38;2;215;0;95m'}}"; BOLD="${{BOLD:-$(tput bold)}}"; RESET="${{RESET:-$(tput sgr0)}}"
 
 if [ "$MODE" = "video" ]; then
   title="$SELECTION"
-  id=$(echo "$title" | sed -E 's/^[0-9]+ //g' | generate_sha256)
+  # Strip the "NN " prefix with parameter expansion; no sed fork per render
+  digits="${{title%%[!0-9]*}}"
+  rest="${{title#"$digits"}}"
+  if [ -n "$digits" ] && [ "${{rest# }}" != "$rest" ]; then title="${{rest# }}"; fi
+  id=$(echo "$title" | generate_sha256)
   if [ -f "{CLI_PREVIEW_SCRIPTS_DIR}/${{id}}.txt" ]; then
     . "{CLI_PREVIEW_SCRIPTS_DIR}/${{id}}.txt"
   else
@@ -212,13 +329,33 @@ def load_config():
         with open(config_file, 'w') as f:
             f.write(f"PRETTY_PRINT: true\nEDITOR: {os.environ.get('EDITOR', 'nano')}\nPREFERRED_SELECTOR: fzf\n")
 
-    with open(config_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'): continue
-            if ': ' in line:
-                key, value = line.split(': ', 1)
-                CONFIG[key] = value
+    # Parsed config is cached on disk keyed by (mtime_ns, size); repeated
+    # launches unpickle the dict instead of re-running the line loop
+    st = os.stat(config_file)
+    sig = (st.st_mtime_ns, st.st_size)
+    cache_file = os.path.join(CLI_CACHE_DIR, "config.v1.pkl")
+    parsed = None
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_sig, cached = pickle.load(f)
+        if cached_sig == sig: parsed = cached
+    except Exception: pass
+
+    if parsed is None:
+        parsed = {}
+        with open(config_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'): continue
+                if ': ' in line:
+                    key, value = line.split(': ', 1)
+                    parsed[key] = value
+        try:
+            with open(cache_file, 'wb') as f:
+                pickle.dump((sig, parsed), f, pickle.HIGHEST_PROTOCOL)
+        except OSError: pass
+
+    CONFIG.update(parsed)
 
     if not CONFIG["IMAGE_RENDERER"]:
         CONFIG["IMAGE_RENDERER"] = "icat" if os.environ.get("KITTY_WINDOW_ID") else "chafa"
@@ -230,7 +367,10 @@ def load_config():
     if not os.path.exists(CONFIG["DOWNLOAD_DIRECTORY"]):
         os.makedirs(CONFIG["DOWNLOAD_DIRECTORY"], exist_ok=True)
 
-    PLAYLIST_END = int(CONFIG["NO_OF_SEARCH_RESULTS"])
+    _refresh_config_ints()
+    PLAYLIST_END = CONFIG_INT["NO_OF_SEARCH_RESULTS"]
+    if not _OPENSSL_HASHLIB:
+        send_notification("hashlib is not OpenSSL-backed; preview hashing will be slow")
     init_pretty_print()
     create_bash_helpers()
     cleanup_cache()
@@ -244,7 +384,12 @@ def load_config():
     --marker=">" --pointer="◆" --separator="─" --scrollbar="│"
     """)
     os.environ["PRETTY_PRINT"] = CONFIG["PRETTY_PRINT"]
-    os.environ["PLATFORM"] = PLATFORM
+    # Pre-export the preview colors so the dispatcher inherits them instead
+    # of shelling out to tput on every fzf preview render
+    os.environ["MAGENTA"] = MAGENTA or "\x1b[38;2;215;0;95m"
+    os.environ["BOLD"] = BOLD or "\033[1m"
+    os.environ["RESET"] = RESET or "\033[0m"
+    os.environ["PLATFORM"] = get_platform()
     os.environ["IMAGE_RENDERER"] = CONFIG["IMAGE_RENDERER"]
 
 def prompt(text, value=""):
@@ -287,10 +432,12 @@ def launcher(options_str, prompt_text, preview_mode=None):
         cmd = ["rofi", "-sort", "-matching", "fuzzy", "-dmenu", "-i", "-p", "", "-mesg", prompt_text, "-matching", "fuzzy", "-sorting-method", "fzf"]
         if CONFIG["ROFI_THEME"]: cmd[1:1] = ["-no-config", "-theme", CONFIG["ROFI_THEME"]]
         else: cmd.extend(["-width", "1500"])
-        clean_options = re.sub(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])', '', options_str)
-        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
-        out, _ = proc.communicate(input=clean_options)
-        res = out.strip()
+        clean_options = _ANSI_RE.sub('', options_str)
+        # Binary pipes: one encode on the way in, one decode on the way out,
+        # no TextIOWrapper buffering either side
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        out, _ = proc.communicate(input=clean_options.encode('utf-8'))
+        res = out.decode('utf-8', 'replace').strip()
         return res if res else "Exit"
     else: # fzf
         cmd = ["fzf", "--info=hidden", "--layout=reverse", "--height=100%", f"--prompt={prompt_text}: ",
@@ -298,43 +445,151 @@ def launcher(options_str, prompt_text, preview_mode=None):
         if preview_mode:
             cmd.extend(["--preview-window=left,35%,wrap", "--bind=right:accept", "--expect=shift-left,shift-right",
                 "--tabstop=1", f"--preview=bash '{CLI_PREVIEW_DISPATCHER}' '{preview_mode}' {{}}"])
-        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
-        out, _ = proc.communicate(input=options_str)
-        lines = out.splitlines()
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        out, _ = proc.communicate(input=options_str.encode('utf-8'))
+        lines = out.decode('utf-8', 'replace').splitlines()
         if not lines: return ""
         if preview_mode and len(lines) >= 2: return lines[1]
         return lines[0]
 
+# yt-dlp is itself a Python package; importing it once and calling it
+# in-process skips a fresh interpreter start plus the JSON serialize/parse
+# round trip per query. False means the module isn't importable (standalone
+# binary install) and every call takes the subprocess path.
+_YTDLP_CLS = None
+
+def _get_ytdlp():
+    global _YTDLP_CLS
+    if _YTDLP_CLS is None:
+        try:
+            from yt_dlp import YoutubeDL
+            _YTDLP_CLS = YoutubeDL
+        except ImportError:
+            _YTDLP_CLS = False
+    return _YTDLP_CLS
+
 def run_yt_dlp(url, extra_args=None):
+    YoutubeDL = _get_ytdlp()
+    if YoutubeDL and not extra_args:
+        opts = {
+            "quiet": True,
+            "no_warnings": True,
+            "extract_flat": "in_playlist",
+            "playliststart": PLAYLIST_START,
+            "playlistend": PLAYLIST_END,
+            "extractor_args": {"youtubetab": {"approximate_date": [""]}},
+        }
+        if CONFIG["PREFERRED_BROWSER"]:
+            browser = CONFIG["PREFERRED_BROWSER"].replace("--cookies-from-browser", "").strip()
+            if browser: opts["cookiesfrombrowser"] = (browser,)
+        try:
+            with YoutubeDL(opts) as ydl:
+                info = ydl.extract_info(url, download=False)
+                return ydl.sanitize_info(info)
+        except Exception:
+            send_notification("Failed to fetch data : (")
+            return None
+
     cmd = ["yt-dlp", url, "-J", "--flat-playlist", "--extractor-args", "youtubetab:approximate_date",
            "--playlist-start", str(PLAYLIST_START), "--playlist-end", str(PLAYLIST_END)]
     if CONFIG["PREFERRED_BROWSER"]: cmd.extend(shlex.split(CONFIG["PREFERRED_BROWSER"]))
     if extra_args: cmd.extend(extra_args)
 
+    # With ijson available, parse entries as yt-dlp streams its dump and
+    # start writing preview scripts / fetching thumbnails for each batch of
+    # eight before the dump has finished; the network tail overlaps the
+    # local preview work instead of preceding it
+    if (ijson is not None and not extra_args and CONFIG["ENABLE_PREVIEW"] == "true"
+            and CONFIG["PREFERRED_SELECTOR"] == "fzf"):
+        sys.stderr.write("Loading...\n")
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        entries, batch, batch_no = [], [], 0
+        try:
+            # use_float: ijson's default Decimal for non-integer fields
+            # (e.g. flat entries' duration) is not JSON-serializable and
+            # would crash the saved/recent list writers downstream
+            for video in ijson.items(proc.stdout, 'entries.item', use_float=True):
+                entries.append(video)
+                batch.append(video)
+                if len(batch) >= 8:
+                    download_preview_images({"entries": batch}, kfile=f"previews.{batch_no}.txt")
+                    batch, batch_no = [], batch_no + 1
+            if batch:
+                download_preview_images({"entries": batch}, kfile=f"previews.{batch_no}.txt")
+        except Exception:
+            proc.kill()
+            entries = None
+        if proc.wait() != 0 or entries is None:
+            send_notification("Failed to fetch data : (")
+            return None
+        # The batches above already covered the whole page, but each call
+        # stamped the manifest with only its own slice. Record the full-page
+        # fingerprint so playlist_explorer's follow-up pass short-circuits
+        # instead of re-queuing thumbnails whose batch curl is still in
+        # flight against the same .part paths
+        manifest, _ = _preview_fingerprint(entries)
+        if manifest:
+            with open(os.path.join(CLI_PREVIEW_IMAGES_CACHE_DIR, ".previews.manifest"), 'w') as f:
+                f.write(manifest)
+        return {"entries": entries}
+
+    # Bytes mode: orjson parses the raw buffer with no intermediate decode
     if shutil.which("gum"):
         spin_cmd = ["gum", "spin", "--show-output", "--"] + cmd
-        proc = subprocess.run(spin_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        proc = subprocess.run(spin_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     else:
         sys.stderr.write("Loading...\n")
-        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
     if proc.returncode != 0:
         send_notification("Failed to fetch data : (")
         return None
-    try: return json.loads(proc.stdout)
-    except json.JSONDecodeError: return None
+    try: return _json_loads(proc.stdout)
+    except ValueError: return None
 
 # ==========================================
 # PREVIEW GENERATION
 # ==========================================
 
+# The per-entry script body, rendered once with the fixed paths baked in;
+# the loop fills the %(...)s slots instead of re-evaluating a large f-string
+_PREVIEW_TPL = f"""
+if [ -f "{CLI_PREVIEW_IMAGES_CACHE_DIR}/%(image_hash)s.jpg" ];then fzf_preview "{CLI_PREVIEW_IMAGES_CACHE_DIR}/%(image_hash)s.jpg" 2>/dev/null;
+else echo loading preview image...;
+fi
+# Build the separator once with builtins; the old per-column echo loop ran
+# up to a couple hundred builtin invocations per render
+printf -v SEP '%%*s' "${{FZF_PREVIEW_COLUMNS}}" ''; SEP="${{SEP// /─}}"
+echo "$SEP"
+echo %(title)s
+printf '%%s' "$SEP"
+printf "${{MAGENTA}}${{BOLD}}Channel: ${{RESET}}%(channel)s\\n";
+printf "${{MAGENTA}}${{BOLD}}Duration: ${{RESET}}%(duration)s\\n";
+printf "${{MAGENTA}}${{BOLD}}View Count: ${{RESET}}%(views)s views\\n";
+printf "${{MAGENTA}}${{BOLD}}Live Status: ${{RESET}}%(live)s\\n";
+printf "${{MAGENTA}}${{BOLD}}Uploaded: ${{RESET}}%(uploaded)s\\n";
+echo "$SEP"
+! [ %(description)s = "null" ] && echo -n %(description)s;
+"""
+
+def _write_preview_script(item):
+    path, content = item
+    with open(path, 'w') as f: f.write(content)
+
 def generate_text_preview(data):
     if not data or "entries" not in data: return
+    # One directory read instead of a stat per entry
+    try:
+        have_scripts = {e.name for e in os.scandir(CLI_PREVIEW_SCRIPTS_DIR)}
+    except OSError:
+        have_scripts = set()
+    scripts = []
     for i, video in enumerate(data["entries"]):
         if not video: continue
         raw_title = video.get("title", "")
-        clean_title = re.sub(r'^[0-9]+ ', '', raw_title)
+        clean_title = _strip_num_prefix(raw_title)
         filename_hash = generate_sha256(clean_title)
+        if f"{filename_hash}.txt" in have_scripts: continue
         safe_title = shlex.quote(clean_title)
         
         thumbs = video.get("thumbnails", [])
@@ -363,58 +618,87 @@ def generate_text_preview(data):
         if ts:
             try:
                 diff = CURRENT_TIME - int(ts)
-                if diff < 60: timestamp_str = "just now"
-                elif diff < 3600: timestamp_str = f"{diff // 60} minutes ago"
-                elif diff < 86400: timestamp_str = f"{diff // 3600} hours ago"
-                elif diff < 604800: timestamp_str = f"{diff // 86400} days ago"
-                elif diff < 2635200: timestamp_str = f"{diff // 604800} weeks ago"
-                elif diff < 31622400: timestamp_str = f"{diff // 2635200} months ago"
-                else: timestamp_str = f"{diff // 31622400} years ago"
+                idx = bisect.bisect_right(_TS_BOUNDS, diff)
+                div, unit = _TS_UNITS[idx]
+                timestamp_str = "just now" if idx == 0 else f"{diff // div} {unit}"
             except: pass
 
-        content = f"""
-if [ -f "{CLI_PREVIEW_IMAGES_CACHE_DIR}/{preview_image_hash}.jpg" ];then fzf_preview "{CLI_PREVIEW_IMAGES_CACHE_DIR}/{preview_image_hash}.jpg" 2>/dev/null;
-else echo loading preview image...;
-fi
-ll=1
-while [ $ll -le $FZF_PREVIEW_COLUMNS ];do echo -n -e "─" ;(( ll++ ));done;
-echo
-echo {safe_title}
-ll=1
-while [ $ll -le $FZF_PREVIEW_COLUMNS ];do echo -n -e "─" ;(( ll++ ));done;
-printf "${{MAGENTA}}${{BOLD}}Channel: ${{RESET}}{safe_channel}\\n";
-printf "${{MAGENTA}}${{BOLD}}Duration: ${{RESET}}{duration_str}\\n";
-printf "${{MAGENTA}}${{BOLD}}View Count: ${{RESET}}{view_count} views\\n";
-printf "${{MAGENTA}}${{BOLD}}Live Status: ${{RESET}}{live_status}\\n";
-printf "${{MAGENTA}}${{BOLD}}Uploaded: ${{RESET}}{timestamp_str}\\n";
-ll=1
-while [ $ll -le $FZF_PREVIEW_COLUMNS ];do echo -n -e "─" ;(( ll++ ));done;
-echo
-! [ {safe_description} = "null" ] && echo -n {safe_description};
-"""
-        with open(os.path.join(CLI_PREVIEW_SCRIPTS_DIR, f"{filename_hash}.txt"), "w") as f: f.write(content)
+        content = _PREVIEW_TPL % {
+            "image_hash": preview_image_hash,
+            "title": safe_title,
+            "channel": safe_channel,
+            "duration": duration_str,
+            "views": view_count,
+            "live": live_status,
+            "uploaded": timestamp_str,
+            "description": safe_description,
+        }
+        scripts.append((os.path.join(CLI_PREVIEW_SCRIPTS_DIR, f"{filename_hash}.txt"), content))
+
+    # The writes are tiny and syscall-bound; a small pool overlaps the
+    # open/write/close round trips instead of paying them serially
+    if scripts:
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            list(ex.map(_write_preview_script, scripts))
+
+def _preview_fingerprint(entries):
+    """Thumbnail URLs of a page and their order-independent fingerprint."""
+    url_list = []
+    for video in entries:
+        if not video: continue
+        thumbs = video.get("thumbnails", [])
+        if thumbs: url_list.append(thumbs[-1]["url"])
+    if not url_list: return None, []
+    manifest = hashlib.blake2b("\n".join(sorted(url_list)).encode('utf-8'), digest_size=8).hexdigest()
+    return manifest, url_list
 
-def download_preview_images(data, prefix=""):
+def download_preview_images(data, prefix="", kfile="previews.txt"):
     if not data or "entries" not in data: return
     generate_text_preview(data)
-    previews_file = os.path.join(CLI_PREVIEW_IMAGES_CACHE_DIR, "previews.txt")
+
+    # Page fingerprint: the same URL set as last time means every thumbnail
+    # was already handled, so skip the per-entry hash+stat pass outright.
+    # The sidecar lives with the images so the 24h sweep ages them together.
+    manifest, url_list = _preview_fingerprint(data["entries"])
+    if not url_list: return
+    manifest_file = os.path.join(CLI_PREVIEW_IMAGES_CACHE_DIR, ".previews.manifest")
+    try:
+        with open(manifest_file) as f:
+            if f.read() == manifest: return
+    except OSError: pass
+
+    previews_file = os.path.join(CLI_PREVIEW_IMAGES_CACHE_DIR, kfile)
     if os.path.exists(previews_file): os.remove(previews_file)
+    try:
+        have_imgs = {e.name for e in os.scandir(CLI_PREVIEW_IMAGES_CACHE_DIR)}
+    except OSError:
+        have_imgs = set()
     entries_to_download = []
-    for video in data["entries"]:
-        if not video: continue
-        thumbs = video.get("thumbnails", [])
-        if not thumbs: continue
-        url = thumbs[-1]["url"]
+    for url in url_list:
         filename = generate_sha256(url)
-        if not os.path.exists(os.path.join(CLI_PREVIEW_IMAGES_CACHE_DIR, f"{filename}.jpg")):
+        if f"{filename}.jpg" not in have_imgs:
             entries_to_download.append((url, filename))
 
     if entries_to_download:
         with open(previews_file, "w") as f:
             for url, filename in entries_to_download:
                 f.write(f'url = "{prefix}{url}"\n')
-                f.write(f'output = "{CLI_PREVIEW_IMAGES_CACHE_DIR}/{filename}.jpg"\n')
-        subprocess.Popen(["curl", "-s", "-K", previews_file], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+                f.write(f'output = "{CLI_PREVIEW_IMAGES_CACHE_DIR}/{filename}.jpg.part"\n')
+        # Download to .part and rename when curl is done: the fzf preview
+        # only ever sees complete .jpg files (rename is atomic within the
+        # directory), so a mid-write read can no longer show a torn image.
+        # Renames are scoped to this batch's files so overlapping fetches
+        # cannot promote each other's half-written parts.
+        curl_cmd = " ".join(shlex.quote(c) for c in
+                            ["curl", "-s"] + _curl_parallel_flags() + ["-K", previews_file])
+        renames = " ".join(
+            f'mv -f "$d/{filename}.jpg.part" "$d/{filename}.jpg" 2>/dev/null;'
+            for url, filename in entries_to_download)
+        script = f'd={shlex.quote(CLI_PREVIEW_IMAGES_CACHE_DIR)}; {curl_cmd}; {renames}'
+        subprocess.Popen(["bash", "-c", script],
+                         stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+
+    with open(manifest_file, 'w') as f: f.write(manifest)
 
 # ==========================================
 # CORE LOGIC
@@ -455,16 +739,16 @@ def playlist_explorer(search_results, url):
         os.system('clear')
 
         if selection == "Next":
-            PLAYLIST_START += int(CONFIG["NO_OF_SEARCH_RESULTS"])
-            PLAYLIST_END += int(CONFIG["NO_OF_SEARCH_RESULTS"])
+            PLAYLIST_START += CONFIG_INT["NO_OF_SEARCH_RESULTS"]
+            PLAYLIST_END += CONFIG_INT["NO_OF_SEARCH_RESULTS"]
             search_results = run_yt_dlp(url)
             download_images = False
             continue
         elif selection == "Previous":
-            PLAYLIST_START -= int(CONFIG["NO_OF_SEARCH_RESULTS"])
+            PLAYLIST_START -= CONFIG_INT["NO_OF_SEARCH_RESULTS"]
             if PLAYLIST_START <= 0: PLAYLIST_START = 1
-            PLAYLIST_END -= int(CONFIG["NO_OF_SEARCH_RESULTS"])
-            min_end = int(CONFIG["NO_OF_SEARCH_RESULTS"])
+            PLAYLIST_END -= CONFIG_INT["NO_OF_SEARCH_RESULTS"]
+            min_end = CONFIG_INT["NO_OF_SEARCH_RESULTS"]
             if PLAYLIST_END < min_end: PLAYLIST_END = min_end
             search_results = run_yt_dlp(url)
             download_images = False
@@ -530,8 +814,8 @@ def playlist_explorer(search_results, url):
                         current_index += 1
                         if current_index >= len(entries):
                             print("End of current list. Fetching next page...")
-                            PLAYLIST_START += int(CONFIG["NO_OF_SEARCH_RESULTS"])
-                            PLAYLIST_END += int(CONFIG["NO_OF_SEARCH_RESULTS"])
+                            PLAYLIST_START += CONFIG_INT["NO_OF_SEARCH_RESULTS"]
+                            PLAYLIST_END += CONFIG_INT["NO_OF_SEARCH_RESULTS"]
                             search_results = run_yt_dlp(url)
                             if not search_results or "entries" not in search_results: break
                             entries = search_results.get("entries", [])
@@ -560,7 +844,7 @@ def playlist_explorer(search_results, url):
                 send_notification(f"Started downloading {clean_title}")
 
     PLAYLIST_START = 1
-    PLAYLIST_END = int(CONFIG["NO_OF_SEARCH_RESULTS"])
+    PLAYLIST_END = CONFIG_INT["NO_OF_SEARCH_RESULTS"]
 
 def main_menu(initial_action=None, search_term=None):
     os.system('clear')
@@ -611,6 +895,7 @@ def main_menu(initial_action=None, search_term=None):
             lines.append(search_term)
             with open(hist_file, 'w') as f: f.write("\n".join(lines) + "\n")
 
+        import urllib.parse
         term_enc = urllib.parse.quote(search_term)
         url = f"https://www.youtube.com/results?search_query={term_enc}&sp={sp}"
         playlist_explorer(run_yt_dlp(url), url)
@@ -622,6 +907,7 @@ def main_menu(initial_action=None, search_term=None):
     main_menu()
 
 if __name__ == "__main__":
+    import argparse
     parser = argparse.ArgumentParser(description=f"Browse youtube from the terminal ({CLI_NAME})")
     parser.add_argument("-S", "--search", help="search for a video")
     parser.add_argument("-e", "--edit-config", action="store_true", help="edit config file")
@@ -9,11 +9,20 @@ import time
 import shutil
 import subprocess
 import hashlib
-import argparse
-import platform
-import urllib.parse
 import re
 import shlex
+from collections import deque
+from functools import lru_cache
+
+try:
+    # Optional C JSON codec; yt-dlp dumps run to megabytes with previews on
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# argparse and urllib.parse are imported where used: neither is needed to
+# render the menus, and --version/--edit-config never touch them
 
 # ==========================================
 # GLOBAL VARIABLES & CONFIGURATION
@@ -34,9 +43,10 @@ CLI_AUTHOR = "Benexl"
 CLI_DIR = os.path.dirname(os.path.realpath(__file__))
 
 # XDG Base Directory specification
-XDG_CONFIG_HOME = os.environ.get("XDG_CONFIG_HOME", os.path.join(os.path.expanduser("~"), ".config"))
-XDG_CACHE_HOME = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
-XDG_VIDEOS_DIR = os.environ.get("XDG_VIDEOS_DIR", os.path.join(os.path.expanduser("~"), "Videos"))
+_HOME = os.path.expanduser("~")
+XDG_CONFIG_HOME = os.environ.get("XDG_CONFIG_HOME", os.path.join(_HOME, ".config"))
+XDG_CACHE_HOME = os.environ.get("XDG_CACHE_HOME", os.path.join(_HOME, ".cache"))
+XDG_VIDEOS_DIR = os.environ.get("XDG_VIDEOS_DIR", os.path.join(_HOME, "Videos"))
 
 CLI_CONFIG_DIR = os.path.join(XDG_CONFIG_HOME, CLI_NAME)
 CLI_EXTENSION_DIR = os.path.join(CLI_CONFIG_DIR, "extensions")
@@ -49,21 +59,32 @@ CLI_HELPER_SCRIPT = os.path.join(CLI_CONFIG_DIR, "yt-x-helper.sh")
 CLI_PREVIEW_DISPATCHER = os.path.join(CLI_CONFIG_DIR, "yt-x-preview.sh")
 CLI_SUPPORT_PROJECT_URL = "https://buymeacoffee.com/benexl"
 
-# Ensure directories exist
-for d in [CLI_CONFIG_DIR, CLI_EXTENSION_DIR, CLI_PREVIEW_IMAGES_CACHE_DIR,
-          CLI_PREVIEW_SCRIPTS_DIR, CLI_YT_DLP_ARCHIVE, CLI_AUTO_GEN_PLAYLISTS]:
-    os.makedirs(d, exist_ok=True)
-
-# Platform detection
-uname = platform.uname().system.lower()
-if "android" in uname or "android" in platform.release().lower():
-    PLATFORM = "android"
-elif "darwin" in uname:
-    PLATFORM = "mac"
-elif "windows" in uname or "microsoft" in platform.release().lower():
-    PLATFORM = "windows"
-else:
-    PLATFORM = "linux"
+# Ensure directories exist; the deepest dir of each tree doubles as its
+# sentinel so an already-initialized tree costs one isdir check instead of
+# the makedirs. Config and cache are checked independently — wiping one
+# tree (e.g. rm -rf ~/.config/yt-browser to reset) must not leave the
+# other's sentinel suppressing its recreation
+if not os.path.isdir(CLI_EXTENSION_DIR):
+    os.makedirs(CLI_EXTENSION_DIR, exist_ok=True)
+if not os.path.isdir(CLI_PREVIEW_SCRIPTS_DIR):
+    for d in (CLI_PREVIEW_IMAGES_CACHE_DIR, CLI_PREVIEW_SCRIPTS_DIR,
+              CLI_YT_DLP_ARCHIVE, CLI_AUTO_GEN_PLAYLISTS):
+        os.makedirs(d, exist_ok=True)
+
+# Platform detection, deferred until first use so startup skips the
+# platform module import
+@lru_cache(maxsize=None)
+def get_platform():
+    import platform
+    uname = platform.uname().system.lower()
+    release = platform.release().lower()
+    if "android" in uname or "android" in release:
+        return "android"
+    if "darwin" in uname:
+        return "mac"
+    if "windows" in uname or "microsoft" in release:
+        return "windows"
+    return "linux"
 
 # Default Config Dictionary
 CONFIG = {
@@ -88,6 +109,19 @@ CONFIG = {
     "AUTO_LOADED_EXTENSIONS": ""
 }
 
+# Typed views of CONFIG, refreshed by load_config(); hot paths read these
+# instead of re-coercing the raw strings on every iteration
+CONFIG_INT = {}
+CONFIG_BOOL = {}
+
+def _refresh_typed_config():
+    CONFIG_INT["NO_OF_SEARCH_RESULTS"] = int(CONFIG["NO_OF_SEARCH_RESULTS"])
+    CONFIG_INT["NOTIFICATION_DURATION"] = int(CONFIG["NOTIFICATION_DURATION"])
+    CONFIG_INT["NO_OF_RECENT"] = int(CONFIG["NO_OF_RECENT"])
+    for key in ("ENABLE_PREVIEW", "UPDATE_RECENT", "SEARCH_HISTORY",
+                "DISOWN_STREAMING_PROCESS", "WELCOME_SCREEN"):
+        CONFIG_BOOL[key] = CONFIG[key] == "true"
+
 # Global State
 PLAYLIST_START = 1
 PLAYLIST_END = 30
@@ -100,56 +134,215 @@ CYAN = ""
 BOLD = ""
 RESET = ""
 
+# Constant menu tails, rebuilt only when the colors change; the per-iteration
+# joins in the explorers append these instead of reformatting five f-strings
+_MENU_TAIL_PREVIEW = ""
+_MENU_TAIL_PLAIN = "\nNext\nPrevious\nBack\nMain Menu\nExit"
+_PLAYLIST_TAIL_PREVIEW = ""
+_PLAYLIST_TAIL_PLAIN = "\nBack\nExit"
+
 # ==========================================
 # HELPER FUNCTIONS
 # ==========================================
 
+@lru_cache(maxsize=4096)
+def _sha256_cached(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
 def generate_sha256(text):
+    # Titles and thumbnail URLs get hashed several times per page; memoize
+    # the common str case and normalize everything else into it
     if text is None:
         text = ""
-    if isinstance(text, str):
-        text = text.encode('utf-8')
-    return hashlib.sha256(text).hexdigest()
+    if isinstance(text, bytes):
+        return hashlib.sha256(text).hexdigest()
+    return _sha256_cached(text)
+
+# Desktop notifier binary, resolved once on first notification
+_NOTIFIER = None
+
+def _get_notifier():
+    global _NOTIFIER
+    if _NOTIFIER is None:
+        if shutil.which("notify-send"):
+            _NOTIFIER = "notify-send"
+        elif shutil.which("termux-notification"):
+            _NOTIFIER = "termux-notification"
+        else:
+            _NOTIFIER = ""
+    return _NOTIFIER
 
 def send_notification(message):
+    # Previously slept NOTIFICATION_DURATION seconds on the main thread;
+    # now the message is emitted and control returns immediately
     sys.stderr.write(f"{message}\n")
-    time.sleep(int(CONFIG["NOTIFICATION_DURATION"]))
+    sys.stderr.flush()
+    notifier = _get_notifier()
+    if notifier == "notify-send":
+        timeout_ms = CONFIG_INT.get("NOTIFICATION_DURATION", 5) * 1000
+        subprocess.Popen([notifier, "-t", str(timeout_ms), CLI_NAME, message],
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+    elif notifier == "termux-notification":
+        subprocess.Popen([notifier, "-t", CLI_NAME, "-c", message],
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+
+# Clear sequence resolved from terminfo once; shelling out to clear forked
+# three processes (sh -> clear -> tput) on every UI transition
+_CLEAR_SEQ = None
+
+def _clear():
+    global _CLEAR_SEQ
+    if _CLEAR_SEQ is None:
+        try:
+            _CLEAR_SEQ = subprocess.check_output(['tput', 'clear'], text=True)
+        except (OSError, subprocess.CalledProcessError):
+            _CLEAR_SEQ = '\x1b[H\x1b[2J'
+    sys.stdout.write(_CLEAR_SEQ)
+    sys.stdout.flush()
+
+def cleanup_cache():
+    """Removes preview images and scripts older than 24 hours to prevent disk bloat."""
+    sentinel = os.path.join(CLI_CACHE_DIR, ".last_cleanup")
+    try:
+        # Recently swept; nothing old enough can have appeared since
+        if time.time() - os.stat(sentinel).st_mtime < 86400:
+            return
+    except OSError:
+        pass
+
+    # Concurrent invocations shouldn't race on the same unlinks
+    lock = None
+    try:
+        import fcntl
+        lock = open(os.path.join(CLI_CACHE_DIR, ".cleanup.lock"), 'w')
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return
+    except ImportError:
+        pass
+
+    cutoff = time.time() - 86400
+    for d in (CLI_PREVIEW_IMAGES_CACHE_DIR, CLI_PREVIEW_SCRIPTS_DIR):
+        try:
+            # DirEntry carries the stat from the directory read: one syscall
+            # per entry instead of three
+            with os.scandir(d) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False) and \
+                                entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                            os.unlink(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    with open(sentinel, 'w'):
+        pass
+    if lock:
+        lock.close()
 
 def byebye(code=0):
-    os.system('clear')
+    _clear()
     user = os.environ.get("USER", "User")
     print(f"Have a good day {user}")
     sys.exit(code)
 
+# Age buckets for the preview "Uploaded" line: (threshold, divisor, unit),
+# scanned in order; None unit means "just now"
+_TS_BUCKETS = (
+    (60, 1, None),
+    (3600, 60, "minutes ago"),
+    (86400, 3600, "hours ago"),
+    (604800, 86400, "days ago"),
+    (2635200, 604800, "weeks ago"),
+    (31622400, 2635200, "months ago"),
+    (float('inf'), 31622400, "years ago"),
+)
+_DUR_BUCKETS = ((3600, "hours"), (60, "mins"))
+
+# Hot-loop patterns compiled once instead of on every selection/preview
+_ICON_PREFIX_RE = re.compile(r'^.. ')
+_ACTION_PREFIX_RE = re.compile(r'.  ')
+_ACTION_SUFFIX_RE = re.compile(r'.*  ')
+_SELECTION_PREFIX_RE = re.compile(r'^[^0-9]*  ')
+_HIST_RE = re.compile(r'^![0-9]{1,2}$')
+_FILTER_RE = re.compile(r'^(:[a-z]+)\s+(.+)')
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# "KEY: value" lines; comments never match the key pattern so no per-line checks
+_CONFIG_RE = re.compile(r'^([A-Z_][A-Z_0-9]*):\s*(.*?)\s*$', re.M)
+
+# Parsed config keyed by the file's (mtime, size); Edit Config -> load_config()
+# round trips skip re-parsing when nothing actually changed
+_CONFIG_CACHE = {"sig": None, "data": None}
+# Last PRETTY_PRINT value the colors were initialized for
+_PRETTY_STATE = None
+# blake2b digests of helper scripts already written by this process
+_HELPER_DIGESTS = {}
+
 def init_pretty_print():
-    global RED, MAGENTA, CYAN, BOLD, RESET
-    if CONFIG["PRETTY_PRINT"] == "true":
+    global RED, MAGENTA, CYAN, BOLD, RESET, _PRETTY_STATE
+    global _MENU_TAIL_PREVIEW, _PLAYLIST_TAIL_PREVIEW
+    if _PRETTY_STATE == CONFIG["PRETTY_PRINT"]:
+        return
+    _PRETTY_STATE = CONFIG["PRETTY_PRINT"]
+    # The tput probes spawned four subprocesses per config load for the same
+    # escape codes every terminal emulator understands; hardcode them
+    if CONFIG["PRETTY_PRINT"] == "true" and sys.stderr.isatty():
+        RED = "\033[31m"
+        MAGENTA = "\x1b[38;2;215;0;95m"
+        CYAN = "\033[36m"
+        BOLD = "\033[1m"
+        RESET = "\033[0m"
+    _MENU_TAIL_PREVIEW = f"\nNext\nPrevious\n{CYAN}\U000f030d{RESET}  Back\n{CYAN}\U000f035c{RESET}  Main Menu\n{RED}\U000f0206{RESET}  Exit"
+    _PLAYLIST_TAIL_PREVIEW = f"\n{CYAN}\U000f030d{RESET}  Back\n{RED}\U000f0206{RESET}  Exit"
+
+# Whether the installed curl understands -Z/--parallel (7.66+); probed once
+_CURL_PARALLEL = None
+
+def _curl_supports_parallel():
+    global _CURL_PARALLEL
+    if _CURL_PARALLEL is None:
         try:
-            RED = subprocess.check_output(['tput', 'setaf', '1'], text=True).strip()
-            MAGENTA = "\x1b[38;2;215;0;95m"
-            CYAN = subprocess.check_output(['tput', 'setaf', '6'], text=True).strip()
-            BOLD = subprocess.check_output(['tput', 'bold'], text=True).strip()
-            RESET = subprocess.check_output(['tput', 'sgr0'], text=True).strip()
-        except:
-            RED = "\033[31m"
-            MAGENTA = "\033[35m"
-            CYAN = "\033[36m"
-            BOLD = "\033[1m"
-            RESET = "\033[0m"
+            version = subprocess.check_output(["curl", "--version"], text=True).split()[1]
+            major, minor = version.split('.')[:2]
+            _CURL_PARALLEL = (int(major), int(minor)) >= (7, 66)
+        except (OSError, subprocess.CalledProcessError, ValueError, IndexError):
+            _CURL_PARALLEL = False
+    return _CURL_PARALLEL
+
+def _write_script_if_changed(path, content):
+    """Write an executable script only when its content actually differs"""
+    digest = hashlib.blake2b(content.encode('utf-8')).digest()
+    if _HELPER_DIGESTS.get(path) == digest:
+        return
+    try:
+        with open(path, 'rb') as f:
+            on_disk = hashlib.blake2b(f.read()).digest()
+    except OSError:
+        on_disk = None
+    if on_disk != digest:
+        with open(path, 'w') as f:
+            f.write(content)
+        os.chmod(path, 0o755)
+    _HELPER_DIGESTS[path] = digest
 
-def create_bash_helpers():
-    """
-    Creates bash scripts for fzf preview logic.
-    This isolates Bash syntax from the user's shell (e.g., Fish).
-    """
+@lru_cache(maxsize=None)
+def _render_helpers(image_renderer, platform_tag):
+    """Render the helper/dispatcher scripts once per (renderer, platform)"""
 
     # 1. Helper Functions Script
     helper_content = f"""#!/usr/bin/env bash
 export CLI_PREVIEW_IMAGES_CACHE_DIR="{CLI_PREVIEW_IMAGES_CACHE_DIR}"
 export CLI_PREVIEW_SCRIPTS_DIR="{CLI_PREVIEW_SCRIPTS_DIR}"
 export CLI_CONFIG_DIR="{CLI_CONFIG_DIR}"
-export IMAGE_RENDERER="{CONFIG['IMAGE_RENDERER']}"
-export PLATFORM="{PLATFORM}"
+export IMAGE_RENDERER="{image_renderer}"
+export PLATFORM="{platform_tag}"
 
 generate_sha256() {{
   local input
@@ -194,10 +387,6 @@ fzf_preview() {{
 export -f generate_sha256
 export -f fzf_preview
 """
-    with open(CLI_HELPER_SCRIPT, 'w') as f:
-        f.write(helper_content)
-    os.chmod(CLI_HELPER_SCRIPT, 0o755)
-
     # 2. Preview Dispatcher Script
     # This script receives the mode and the selection string from fzf
     preview_content = f"""#!/usr/bin/env bash
@@ -268,9 +457,16 @@ elif [ "$MODE" = "playlist" ]; then
   fi
 fi
 """
-    with open(CLI_PREVIEW_DISPATCHER, 'w') as f:
-        f.write(preview_content)
-    os.chmod(CLI_PREVIEW_DISPATCHER, 0o755)
+    return helper_content, preview_content
+
+def create_bash_helpers():
+    """
+    Creates bash scripts for fzf preview logic.
+    This isolates Bash syntax from the user's shell (e.g., Fish).
+    """
+    helper_content, preview_content = _render_helpers(CONFIG['IMAGE_RENDERER'], get_platform())
+    _write_script_if_changed(CLI_HELPER_SCRIPT, helper_content)
+    _write_script_if_changed(CLI_PREVIEW_DISPATCHER, preview_content)
 
 def load_config():
     global CONFIG, PLAYLIST_END
@@ -280,13 +476,14 @@ def load_config():
         with open(config_file, 'w') as f:
             f.write(f"PRETTY_PRINT: true\nEDITOR: {os.environ.get('EDITOR', 'open')}\nPREFERRED_SELECTOR: fzf\n")
 
-    with open(config_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'): continue
-            if ': ' in line:
-                key, value = line.split(': ', 1)
-                CONFIG[key] = value
+    st = os.stat(config_file)
+    sig = (st.st_mtime, st.st_size)
+    if _CONFIG_CACHE["sig"] != sig:
+        with open(config_file, 'r') as f:
+            text = f.read()
+        _CONFIG_CACHE["sig"] = sig
+        _CONFIG_CACHE["data"] = dict(_CONFIG_RE.findall(text))
+    CONFIG.update(_CONFIG_CACHE["data"])
 
     if not CONFIG["IMAGE_RENDERER"]:
         CONFIG["IMAGE_RENDERER"] = "icat" if os.environ.get("KITTY_WINDOW_ID") else "chafa"
@@ -298,7 +495,8 @@ def load_config():
     if not os.path.exists(CONFIG["DOWNLOAD_DIRECTORY"]):
         os.makedirs(CONFIG["DOWNLOAD_DIRECTORY"], exist_ok=True)
 
-    PLAYLIST_END = int(CONFIG["NO_OF_SEARCH_RESULTS"])
+    _refresh_typed_config()
+    PLAYLIST_END = CONFIG_INT["NO_OF_SEARCH_RESULTS"]
     init_pretty_print()
     create_bash_helpers()
 
@@ -311,7 +509,7 @@ def load_config():
     --marker=">" --pointer="◆" --separator="─" --scrollbar="│"
     """)
     os.environ["PRETTY_PRINT"] = CONFIG["PRETTY_PRINT"]
-    os.environ["PLATFORM"] = PLATFORM
+    os.environ["PLATFORM"] = get_platform()
     os.environ["IMAGE_RENDERER"] = CONFIG["IMAGE_RENDERER"]
 
 def confirm(question):
@@ -331,16 +529,18 @@ def prompt(text, value=""):
     history_file = os.path.join(CLI_CACHE_DIR, "search_history.txt")
     history_text = ""
     if os.path.exists(history_file):
+        # Bounded deque keeps the last 10 without materializing the whole file
+        dq = deque(maxlen=10)
         with open(history_file, 'r') as f:
-            lines = [l.strip() for l in f if l.strip()]
-        lines = lines[-10:]
+            dq.extend(l.strip() for l in f if l.strip())
+        lines = list(dq)
         lines.reverse()
         history_formatted = "\n".join([f"{i+1}. {l}" for i, l in enumerate(lines)])
         history_text = f"Search history:\n{history_formatted}\n(Enter !<n> to select from history. Example: !1)\n"
 
     if CONFIG["PREFERRED_SELECTOR"] == "rofi":
         cmd = ["rofi", "-dmenu", "-p", f"{text}: "]
-        if CONFIG["SEARCH_HISTORY"] == "true" and history_text:
+        if CONFIG_BOOL["SEARCH_HISTORY"] and history_text:
              cmd.extend(["-mesg", history_text])
 
         proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
@@ -349,7 +549,7 @@ def prompt(text, value=""):
 
     elif shutil.which("gum"):
         header = CLI_HEADER
-        if CONFIG["SEARCH_HISTORY"] == "true" and history_text:
+        if CONFIG_BOOL["SEARCH_HISTORY"] and history_text:
             header += "\n" + history_text
 
         cmd = ["gum", "input", "--header", header, "--prompt", f"{text}: ", "--value", value]
@@ -358,7 +558,7 @@ def prompt(text, value=""):
 
     else:
         sys.stderr.write(f"{CLI_HEADER}\n")
-        if CONFIG["SEARCH_HISTORY"] == "true" and history_text:
+        if CONFIG_BOOL["SEARCH_HISTORY"] and history_text:
             sys.stderr.write(f"{history_text}\n")
         sys.stderr.write(f"{text}: ")
         sys.stderr.flush()
@@ -377,9 +577,9 @@ def launcher(options_str, prompt_text, preview_mode=None):
         else:
             cmd.extend(["-width", "1500"])
 
-        clean_options = re.sub(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])', '', options_str)
-        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
-        out, _ = proc.communicate(input=clean_options)
+        clean_options = _ANSI_RE.sub('', options_str)
+        out = subprocess.run(cmd, input=clean_options, stdout=subprocess.PIPE,
+                             stderr=subprocess.DEVNULL, text=True).stdout
         res = out.strip()
         return res if res else "Exit"
 
@@ -407,8 +607,8 @@ def launcher(options_str, prompt_text, preview_mode=None):
                 f"--preview=bash '{CLI_PREVIEW_DISPATCHER}' '{preview_mode}' {{}}"
             ])
 
-        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
-        out, _ = proc.communicate(input=options_str)
+        out = subprocess.run(cmd, input=options_str, stdout=subprocess.PIPE,
+                             text=True).stdout
 
         lines = out.splitlines()
         if not lines:
@@ -427,77 +627,93 @@ def run_yt_dlp(url, extra_args=None):
     if extra_args:
         cmd.extend(extra_args)
 
+    # Bytes mode: orjson parses the raw buffer with no intermediate decode
     if shutil.which("gum"):
         spin_cmd = ["gum", "spin", "--show-output", "--"] + cmd
-        proc = subprocess.run(spin_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        proc = subprocess.run(spin_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     else:
         sys.stderr.write("Loading...\n")
-        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
     if proc.returncode != 0:
         send_notification("Failed to fetch data : (")
         return None
 
     try:
-        return json.loads(proc.stdout)
-    except json.JSONDecodeError:
+        return _json_loads(proc.stdout)
+    except ValueError:
         return None
 
 # ==========================================
 # PREVIEW GENERATION
 # ==========================================
 
-def generate_text_preview(data):
+def generate_text_preview(data, display_titles=None):
+    """display_titles maps entry index -> the numbered title fzf will hash"""
     if not data or "entries" not in data:
         return
 
     entries = data["entries"]
-    for i, video in enumerate(entries):
-        if not video: continue
-
-        title = (video.get("title") or "").replace('"', '\\"').replace('%', '%%').replace('$', '\\$')
-        title = re.sub(r'^.. ', '', title)
-
-        filename_hash = generate_sha256(video.get("title", ""))
-
-        thumbs = video.get("thumbnails", [])
-        thumb_url = thumbs[-1]["url"] if thumbs else ""
-        preview_image_hash = generate_sha256(thumb_url)
-
-        vc = video.get("view_count")
-        view_count = "{:,}".format(int(vc)) if vc is not None else "Unknown"
-
-        ls = video.get("live_status")
-        live_status = "Online" if ls == "is_live" else ("Offline" if ls == "was_live" else "False")
-
-        description = (video.get("description") or "null").replace('"', '').replace('%', '')
-        channel = video.get("channel", "")
-
-        dur = video.get("duration")
-        duration_str = "Unknown"
-        if dur:
-            try:
-                dur = float(dur)
-                if dur >= 3600: duration_str = f"{int(dur // 3600)} hours"
-                elif dur >= 60: duration_str = f"{int(dur // 60)} mins"
-                else: duration_str = f"{int(dur)} secs"
-            except: pass
-
-        ts = video.get("timestamp")
-        timestamp_str = ""
-        if ts:
+    # Pre-opened directory fd: each script write resolves one basename
+    # instead of walking the whole cache path
+    dfd = os.open(CLI_PREVIEW_SCRIPTS_DIR, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for i, video in enumerate(entries):
+            if not video: continue
+
+            shown_title = display_titles.get(i) if display_titles else None
+            if shown_title is None:
+                shown_title = video.get("title", "")
+            filename_hash = generate_sha256(shown_title)
+            script_name = f"{filename_hash}.txt"
+            # Already generated on a previous visit; paging back is a no-op
             try:
-                diff = CURRENT_TIME - int(ts)
-                if diff < 60: timestamp_str = "just now"
-                elif diff < 3600: timestamp_str = f"{diff // 60} minutes ago"
-                elif diff < 86400: timestamp_str = f"{diff // 3600} hours ago"
-                elif diff < 604800: timestamp_str = f"{diff // 86400} days ago"
-                elif diff < 2635200: timestamp_str = f"{diff // 604800} weeks ago"
-                elif diff < 31622400: timestamp_str = f"{diff // 2635200} months ago"
-                else: timestamp_str = f"{diff // 31622400} years ago"
-            except: pass
-
-        content = f"""
+                os.stat(script_name, dir_fd=dfd)
+                continue
+            except FileNotFoundError:
+                pass
+
+            title = (shown_title or "").replace('"', '\\"').replace('%', '%%').replace('$', '\\$')
+            title = _ICON_PREFIX_RE.sub('', title)
+
+            thumbs = video.get("thumbnails", [])
+            thumb_url = thumbs[-1]["url"] if thumbs else ""
+            preview_image_hash = generate_sha256(thumb_url)
+
+            vc = video.get("view_count")
+            view_count = "{:,}".format(int(vc)) if vc is not None else "Unknown"
+
+            ls = video.get("live_status")
+            live_status = "Online" if ls == "is_live" else ("Offline" if ls == "was_live" else "False")
+
+            description = (video.get("description") or "null").replace('"', '').replace('%', '')
+            channel = video.get("channel", "")
+
+            dur = video.get("duration")
+            duration_str = "Unknown"
+            if dur:
+                try:
+                    dur = float(dur)
+                    for div, unit in _DUR_BUCKETS:
+                        if dur >= div:
+                            duration_str = f"{int(dur // div)} {unit}"
+                            break
+                    else:
+                        duration_str = f"{int(dur)} secs"
+                except: pass
+
+            ts = video.get("timestamp")
+            timestamp_str = ""
+            if ts:
+                try:
+                    diff = CURRENT_TIME - int(ts)
+                    for thr, div, unit in _TS_BUCKETS:
+                        if diff < thr:
+                            timestamp_str = "just now" if unit is None else f"{diff // div} {unit}"
+                            break
+                except: pass
+
+            content = f"""
 if [ -f "{CLI_PREVIEW_IMAGES_CACHE_DIR}/{preview_image_hash}.jpg" ];then fzf_preview "{CLI_PREVIEW_IMAGES_CACHE_DIR}/{preview_image_hash}.jpg" 2>/dev/null;
 else echo loading preview image...;
 fi
@@ -521,15 +737,22 @@ echo
 
 ! [ "{description}" = "null" ] && echo -n "{description}";
 """
-        with open(os.path.join(CLI_PREVIEW_SCRIPTS_DIR, f"{filename_hash}.txt"), "w") as f:
-            f.write(content)
+            fd = os.open(script_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dfd)
+            with os.fdopen(fd, 'w') as f:
+                f.write(content)
+    finally:
+        os.close(dfd)
 
-def download_preview_images(data, prefix=""):
+def download_preview_images(data, prefix="", display_titles=None):
     if not data or "entries" not in data: return
-    generate_text_preview(data)
 
     previews_file = os.path.join(CLI_PREVIEW_IMAGES_CACHE_DIR, "previews.txt")
-    if os.path.exists(previews_file): os.remove(previews_file)
+
+    # One directory scan instead of a stat per thumbnail
+    try:
+        cached_images = {e.name for e in os.scandir(CLI_PREVIEW_IMAGES_CACHE_DIR) if e.is_file()}
+    except OSError:
+        cached_images = set()
 
     entries_to_download = []
     for video in data["entries"]:
@@ -539,16 +762,25 @@ def download_preview_images(data, prefix=""):
         url = thumbs[-1]["url"]
         filename = generate_sha256(url)
 
-        if not os.path.exists(os.path.join(CLI_PREVIEW_IMAGES_CACHE_DIR, f"{filename}.jpg")):
+        if f"{filename}.jpg" not in cached_images:
             entries_to_download.append((url, filename))
 
     if entries_to_download:
+        if os.path.exists(previews_file): os.remove(previews_file)
         with open(previews_file, "w") as f:
             for url, filename in entries_to_download:
                 f.write(f'url = "{prefix}{url}"\n')
                 f.write(f'output = "{CLI_PREVIEW_IMAGES_CACHE_DIR}/{filename}.jpg"\n')
 
-        subprocess.Popen(["curl", "-s", "-K", previews_file], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+        cmd = ["curl", "-s", "--compressed", "-K", previews_file]
+        if _curl_supports_parallel():
+            # Thumbnails are latency-bound; fetch them concurrently
+            cmd[1:1] = ["-Z", "--parallel-max", "16"]
+        subprocess.Popen(cmd, stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+
+    # Scripts are written while curl is already pulling thumbnails, so the
+    # network and disk halves of preview generation overlap
+    generate_text_preview(data, display_titles)
 
 # ==========================================
 # CORE LOGIC
@@ -566,9 +798,10 @@ def update_json_list(filename, video, add=True, limit=None):
     data["entries"] = [e for e in data["entries"] if e.get("id") != vid_id]
 
     if add:
-        video_copy = video.copy()
-        video_copy["title"] = re.sub(r'^[0-9]+ ', '', video_copy.get("title", ""))
-        data["entries"].append(video_copy)
+        # Titles arrive clean: enumeration lives in display_titles only and
+        # never touches the entries, so stripping here would eat leading
+        # digits belonging to the real title
+        data["entries"].append(video.copy())
 
     if limit and len(data["entries"]) > limit:
         data["entries"] = data["entries"][-limit:]
@@ -576,8 +809,8 @@ def update_json_list(filename, video, add=True, limit=None):
     with open(filepath, 'w') as f: json.dump(data, f)
 
 def update_recent(video):
-    if CONFIG["UPDATE_RECENT"] != "true": return
-    update_json_list("recent.json", video, add=True, limit=int(CONFIG["NO_OF_RECENT"]))
+    if not CONFIG_BOOL["UPDATE_RECENT"]: return
+    update_json_list("recent.json", video, add=True, limit=CONFIG_INT["NO_OF_RECENT"])
 
 def playlist_explorer(search_results, url, urlForAll=None):
     global PLAYLIST_START, PLAYLIST_END
@@ -588,46 +821,42 @@ def playlist_explorer(search_results, url, urlForAll=None):
         if not search_results or "entries" not in search_results: break
 
         entries = search_results.get("entries", [])
+        # Numbering is derived for display only; the yt-dlp entries are left
+        # untouched so paging cycles cannot double-prefix their titles
+        display_titles = {}
         titles = []
-        
-        # Only modify titles if we haven't already processed this batch (download_images is False)
-        if not download_images:
-            for i, entry in enumerate(entries):
-                if not entry: continue
-                num = str(i + 1)
-                if len(entries) < 10 and len(num) < 2: num = "0" + num
-                entry["title"] = f"{num} {entry.get('title', '')}"
-                titles.append(entry["title"])
-        else:
-            # If already processed, just rebuild the titles list from the existing entries
-            for entry in entries:
-                if entry: titles.append(entry.get("title", ""))
-
-        if CONFIG["ENABLE_PREVIEW"] == "true" and CONFIG["PREFERRED_SELECTOR"] == "fzf" and not download_images:
-            download_preview_images(search_results)
+        for i, entry in enumerate(entries):
+            if not entry: continue
+            num = str(i + 1)
+            if len(entries) < 10 and len(num) < 2: num = "0" + num
+            display_titles[i] = f"{num} {entry.get('title', '')}"
+            titles.append(display_titles[i])
+
+        if CONFIG_BOOL["ENABLE_PREVIEW"] and CONFIG["PREFERRED_SELECTOR"] == "fzf" and not download_images:
+            download_preview_images(search_results, display_titles=display_titles)
             download_images = True
 
-        if CONFIG["ENABLE_PREVIEW"] == "true":
-            options_str = "\n".join(titles) + f"\nNext\nPrevious\n{CYAN}󰌍{RESET}  Back\n{CYAN}󰍜{RESET}  Main Menu\n{RED}󰈆{RESET}  Exit"
+        if CONFIG_BOOL["ENABLE_PREVIEW"]:
+            options_str = "\n".join(titles) + _MENU_TAIL_PREVIEW
             selection = launcher(options_str, "select video", "video")
         else:
-            options_str = "\n".join(titles + ["Next", "Previous", "Back", "Main Menu", "Exit"])
+            options_str = "\n".join(titles) + _MENU_TAIL_PLAIN
             selection = launcher(options_str, "select video")
 
-        selection = re.sub(r'^[^0-9]*  ', '', selection)
-        os.system('clear')
+        selection = _SELECTION_PREFIX_RE.sub('', selection)
+        _clear()
 
         if selection == "Next":
-            PLAYLIST_START += int(CONFIG["NO_OF_SEARCH_RESULTS"])
-            PLAYLIST_END += int(CONFIG["NO_OF_SEARCH_RESULTS"])
+            PLAYLIST_START += CONFIG_INT["NO_OF_SEARCH_RESULTS"]
+            PLAYLIST_END += CONFIG_INT["NO_OF_SEARCH_RESULTS"]
             search_results = run_yt_dlp(url)
             download_images = False
             continue
         elif selection == "Previous":
-            PLAYLIST_START -= int(CONFIG["NO_OF_SEARCH_RESULTS"])
+            PLAYLIST_START -= CONFIG_INT["NO_OF_SEARCH_RESULTS"]
             if PLAYLIST_START <= 0: PLAYLIST_START = 1
-            PLAYLIST_END -= int(CONFIG["NO_OF_SEARCH_RESULTS"])
-            if PLAYLIST_END <= int(CONFIG["NO_OF_SEARCH_RESULTS"]): PLAYLIST_END = int(CONFIG["NO_OF_SEARCH_RESULTS"])
+            PLAYLIST_END -= CONFIG_INT["NO_OF_SEARCH_RESULTS"]
+            if PLAYLIST_END <= CONFIG_INT["NO_OF_SEARCH_RESULTS"]: PLAYLIST_END = CONFIG_INT["NO_OF_SEARCH_RESULTS"]
             search_results = run_yt_dlp(url)
             download_images = False
             continue
@@ -639,7 +868,7 @@ def playlist_explorer(search_results, url, urlForAll=None):
         try:
             sel_id = int(selection.split(' ')[0])
             video = entries[sel_id - 1]
-            clean_title = re.sub(r'^[0-9]+ ', '', video['title'])
+            clean_title = video.get("title", "")
         except (ValueError, IndexError): continue
 
         while True:
@@ -654,8 +883,8 @@ def playlist_explorer(search_results, url, urlForAll=None):
             ]
 
             action_sel = launcher("\n".join(media_actions), "Select Media Action")
-            action_sel = re.sub(r'.  ', '', action_sel)
-            os.system('clear')
+            action_sel = _ACTION_PREFIX_RE.sub('', action_sel)
+            _clear()
 
             if action_sel == "Exit": byebye()
             if action_sel in ["Back", ""]: break
@@ -675,25 +904,25 @@ def playlist_explorer(search_results, url, urlForAll=None):
                                 f.write('#EXTM3U\n')
                                 for entry in mix_data.get('entries', []):
                                     f.write(f"#EXTINF:-1,{entry.get('title')}\n{entry.get('url')}\n\n")
-                    subprocess.Popen(["mpv", cached_pl], start_new_session=(CONFIG["DISOWN_STREAMING_PROCESS"]=="true"))
+                    subprocess.Popen(["mpv", cached_pl], start_new_session=(CONFIG_BOOL["DISOWN_STREAMING_PROCESS"]))
                 else:
-                    if CONFIG["PLAYER"] != "mpv" or PLATFORM == "android":
+                    if CONFIG["PLAYER"] != "mpv" or get_platform() == "android":
                         proc = subprocess.run(["yt-dlp", vid_url, "-q", "--no-warnings", "--get-url", "--format", f"best[height<={CONFIG['VIDEO_QUALITY']}]/best"], stdout=subprocess.PIPE, text=True)
                         vid_url = proc.stdout.strip().split('\n')[-1] if proc.stdout.strip() else ""
 
                     if CONFIG["PLAYER"] == "mpv":
-                        subprocess.Popen(["mpv", vid_url], start_new_session=(CONFIG["DISOWN_STREAMING_PROCESS"]=="true"))
+                        subprocess.Popen(["mpv", vid_url], start_new_session=(CONFIG_BOOL["DISOWN_STREAMING_PROCESS"]))
                     elif CONFIG["PLAYER"] == "vlc":
-                        subprocess.Popen(["vlc", vid_url, "--video-title", clean_title], start_new_session=(CONFIG["DISOWN_STREAMING_PROCESS"]=="true"))
+                        subprocess.Popen(["vlc", vid_url, "--video-title", clean_title], start_new_session=(CONFIG_BOOL["DISOWN_STREAMING_PROCESS"]))
                 update_recent(video)
 
             elif action_sel == "Listen":
                 print(f"{MAGENTA}Now Listening to:{RESET} {clean_title}")
-                if CONFIG["PLAYER"] != "mpv" or PLATFORM == "android":
+                if CONFIG["PLAYER"] != "mpv" or get_platform() == "android":
                      proc = subprocess.run(["yt-dlp", vid_url, "-q", "--no-warnings", "--get-url", "--format", "bestaudio/best"], stdout=subprocess.PIPE, text=True)
                      vid_url = proc.stdout.strip().split('\n')[-1]
                 if CONFIG["PLAYER"] == "mpv":
-                    subprocess.Popen(["mpv", vid_url, "--no-video", "--force-window=no"], start_new_session=(CONFIG["DISOWN_STREAMING_PROCESS"]=="true"))
+                    subprocess.Popen(["mpv", vid_url, "--no-video", "--force-window=no"], start_new_session=(CONFIG_BOOL["DISOWN_STREAMING_PROCESS"]))
                 update_recent(video)
 
             elif action_sel == "Download":
@@ -745,7 +974,7 @@ def playlist_explorer(search_results, url, urlForAll=None):
                     subprocess.run([user_shell], env=shell_env)
 
     PLAYLIST_START = 1
-    PLAYLIST_END = int(CONFIG["NO_OF_SEARCH_RESULTS"])
+    PLAYLIST_END = CONFIG_INT["NO_OF_SEARCH_RESULTS"]
 
 def playlists_explorer(url):
     playlist_results = run_yt_dlp(url)
@@ -760,19 +989,19 @@ def playlists_explorer(url):
         titles.append(entry["title"])
 
     os.environ["playlist_results"] = json.dumps(playlist_results)
-    if CONFIG["ENABLE_PREVIEW"] == "true" and CONFIG["PREFERRED_SELECTOR"] == "fzf":
+    if CONFIG_BOOL["ENABLE_PREVIEW"] and CONFIG["PREFERRED_SELECTOR"] == "fzf":
         download_preview_images(playlist_results)
 
     while True:
-        if CONFIG["ENABLE_PREVIEW"] == "true":
-            options = "\n".join(titles) + f"\n{CYAN}󰌍{RESET}  Back\n{RED}󰈆{RESET}  Exit"
+        if CONFIG_BOOL["ENABLE_PREVIEW"]:
+            options = "\n".join(titles) + _PLAYLIST_TAIL_PREVIEW
             sel = launcher(options, "select video", "playlist")
         else:
-            options = "\n".join(titles) + "\nBack\nExit"
+            options = "\n".join(titles) + _PLAYLIST_TAIL_PLAIN
             sel = launcher(options, "select video")
 
-        sel = re.sub(r'^[^0-9]*  ', '', sel).strip()
-        os.system('clear')
+        sel = _SELECTION_PREFIX_RE.sub('', sel).strip()
+        _clear()
 
         if "Back" in sel or not sel: break
         if "Exit" in sel: byebye()
@@ -792,7 +1021,7 @@ def channels_explorer(channel):
             f"{RED}󰈆{RESET}  Exit"
         ]
         sel = launcher("\n".join(actions), "Select Action")
-        sel = re.sub(r'.  ', '', sel)
+        sel = _ACTION_PREFIX_RE.sub('', sel)
 
         if sel == "Exit": byebye()
         if sel in ["Back", ""]: break
@@ -802,8 +1031,9 @@ def channels_explorer(channel):
         elif sel == "Streams": playlist_explorer(run_yt_dlp(f"{uploader_url}/streams"), f"{uploader_url}/streams")
         elif sel == "Playlists": playlists_explorer(f"{uploader_url}/playlists")
         elif sel == "Search":
-            os.system('clear')
+            _clear()
             term = prompt("Enter term to search for")
+            import urllib.parse
             term_enc = urllib.parse.quote(term)
             url = f"{uploader_url}/search?query={term_enc}"
             playlist_explorer(run_yt_dlp(url), url)
@@ -822,10 +1052,10 @@ def channels_explorer(channel):
             data["entries"].append(channel)
             with open(sub_file, 'w') as f: json.dump(data, f)
             send_notification("successfully subscribed")
-        os.system('clear')
+        _clear()
 
 def main_menu(initial_action=None, search_term=None):
-    os.system('clear')
+    _clear()
     action = initial_action
     if not action:
         options = [
@@ -837,27 +1067,30 @@ def main_menu(initial_action=None, search_term=None):
             f"{RED}󰈆{RESET}  Exit"
         ]
         sel = launcher("\n".join(options), "Select Action")
-        action = re.sub(r'.*  ', '', sel)
+        action = _ACTION_SUFFIX_RE.sub('', sel)
 
     if action == "Exit": byebye()
 
     if action == "Your Feed": playlist_explorer(run_yt_dlp("https://www.youtube.com"), "https://www.youtube.com")
     elif action == "Trending": playlist_explorer(run_yt_dlp("https://www.youtube.com/feed/trending"), "https://www.youtube.com/feed/trending")
     elif action == "Search":
-        os.system('clear')
+        _clear()
         if not search_term:
             search_term = prompt("Enter term to search for")
-            if re.match(r'^![0-9]{1,2}$', search_term):
+            if _HIST_RE.match(search_term):
                 idx = int(search_term[1:])
                 hist_file = os.path.join(CLI_CACHE_DIR, "search_history.txt")
                 if os.path.exists(hist_file):
-                    with open(hist_file) as f: lines = [l.strip() for l in f if l.strip()]
+                    dq = deque(maxlen=10)
+                    with open(hist_file) as f:
+                        dq.extend(l.strip() for l in f if l.strip())
+                    lines = list(dq)
                     if lines and idx <= 10: search_term = lines[-idx]
 
         if not search_term: return main_menu()
 
         sp = "EgIQAQ%253D%253D"
-        match = re.match(r'^(:[a-z]+)\s+(.+)', search_term)
+        match = _FILTER_RE.match(search_term)
         if match:
             filter_cmd, search_term = match.groups()
             if filter_cmd == ":hour": sp="EgIIAQ%253D%253D"
@@ -866,14 +1099,17 @@ def main_menu(initial_action=None, search_term=None):
             elif filter_cmd == ":month": sp="EgIIBA%253D%253D"
             elif filter_cmd == ":year": sp="EgIIBQ%253D%253D"
 
-        if CONFIG["SEARCH_HISTORY"] == "true":
+        if CONFIG_BOOL["SEARCH_HISTORY"]:
             hist_file = os.path.join(CLI_CACHE_DIR, "search_history.txt")
             lines = []
             if os.path.exists(hist_file):
                 with open(hist_file) as f: lines = [l.strip() for l in f if l.strip() and l.strip() != search_term]
             lines.append(search_term)
+            # Bound on-disk growth; only the last 10 are ever shown anyway
+            lines = lines[-500:]
             with open(hist_file, 'w') as f: f.write("\n".join(lines) + "\n")
 
+        import urllib.parse
         term_enc = urllib.parse.quote(search_term)
         url = f"https://www.youtube.com/results?search_query={term_enc}&sp={sp}"
         playlist_explorer(run_yt_dlp(url), url)
@@ -905,6 +1141,7 @@ def main_menu(initial_action=None, search_term=None):
     main_menu()
 
 if __name__ == "__main__":
+    import argparse
     parser = argparse.ArgumentParser(description=f"Browse youtube from the terminal ({CLI_NAME})")
     parser.add_argument("-S", "--search", help="search for a video")
     parser.add_argument("-e", "--edit-config", action="store_true", help="edit config file")
@@ -929,6 +1166,10 @@ if __name__ == "__main__":
         sys.exit(0)
 
     load_config()
+    # Sweep the cache off the startup path; the menu paints immediately
+    # while stale previews are unlinked behind it
+    import threading
+    threading.Thread(target=cleanup_cache, daemon=True).start()
 
     if args.preferred_selector: CONFIG["PREFERRED_SELECTOR"] = args.preferred_selector
     if args.player: CONFIG["PLAYER"] = args.player
@@ -937,6 +1178,7 @@ if __name__ == "__main__":
     if args.rofi_theme: CONFIG["ROFI_THEME"] = args.rofi_theme
     if args.disown_streaming_process: CONFIG["DISOWN_STREAMING_PROCESS"] = "true"
     if args.no_disown_streaming_process: CONFIG["DISOWN_STREAMING_PROCESS"] = "false"
+    _refresh_typed_config()
 
     if args.edit_config:
         subprocess.run([CONFIG["EDITOR"], os.path.join(CLI_CONFIG_DIR, f"{CLI_NAME}.conf")])
@@ -947,7 +1189,7 @@ if __name__ == "__main__":
             print(f"{dep} is not installed and is a core dep please install it to proceed")
             sys.exit(1)
 
-    if CONFIG["WELCOME_SCREEN"] == "true":
+    if CONFIG_BOOL["WELCOME_SCREEN"]:
         ts_file = os.path.join(CLI_CACHE_DIR, ".last_welcome")
         last = 0
         if os.path.exists(ts_file):